@@ -15,19 +15,21 @@ from fastapi import HTTPException, Request, Response
 from fastapi.routing import APIRoute
 from fastapi.utils import is_body_allowed_for_status_code
 from fastapi_problem.error import BadRequestProblem, StatusProblem
+from starlette.datastructures import MutableHeaders
 from starlette.requests import Request as StarletteRequest
 
 from app.core.content_negotiation import (
     ALLOWED_CONTENT_TYPES,
     CBOR_MEDIA_TYPE,
     JSON_MEDIA_TYPE,
-    content_type_is_allowed,
     content_type_matches,
     negotiate_api_media_type,
     negotiate_problem_media_type,
     normalize_media_type,
 )
 
+_ALLOWED_CONTENT_TYPES_TEXT = ", ".join(sorted(ALLOWED_CONTENT_TYPES))
+
 
 class CBORDecodeError(Exception):
     """
@@ -121,14 +123,14 @@ class CBORRequest(StarletteRequest):
         if not hasattr(self, "_body"):
             body = await super().body()
             content_type = self.headers.get("content-type", "")
+            media_type = normalize_media_type(content_type)
 
-            if body and content_type and not content_type_is_allowed(content_type, ALLOWED_CONTENT_TYPES):
-                normalized = normalize_media_type(content_type)
+            if body and content_type and media_type not in ALLOWED_CONTENT_TYPES:
                 raise UnsupportedMediaTypeHTTPException(
-                    detail=f"Content-Type '{normalized}' not supported. Use: {', '.join(sorted(ALLOWED_CONTENT_TYPES))}"
+                    detail=f"Content-Type '{media_type}' not supported. Use: {_ALLOWED_CONTENT_TYPES_TEXT}"
                 )
 
-            if body and content_type_matches(content_type, CBOR_MEDIA_TYPE):
+            if body and media_type == CBOR_MEDIA_TYPE:
                 try:
                     decoded = cbor2.loads(body)
                     body = json.dumps(decoded).encode("utf-8")
@@ -149,10 +151,8 @@ class CBORRequest(StarletteRequest):
         """
         Update Content-Type header in scope to application/json.
         """
-        # Rebuild headers without original content-type, then add json content-type
-        new_headers = [(key, value) for key, value in self.scope["headers"] if key.lower() != b"content-type"]
-        new_headers.append((b"content-type", b"application/json"))
-        self.scope["headers"] = new_headers
+        # Replace the scope's header list with a copy holding a single content-type entry
+        MutableHeaders(scope=self.scope)["content-type"] = JSON_MEDIA_TYPE
         # Clear cached _headers so next access rebuilds from scope
         if hasattr(self, "_headers"):
             del self._headers
@@ -183,7 +183,9 @@ class CBORRoute(APIRoute):
 
         async def custom_handler(request: Request) -> Response:
             # RFC 9110 list-based fields can be split across multiple field lines.
-            accept = ",".join(request.headers.getlist("accept"))
+            # Scan the raw ASGI headers (names are lowercase) like Headers.getlist
+            # does, without building a Headers mapping for this single lookup.
+            accept = ",".join(value.decode("latin-1") for key, value in request.scope["headers"] if key == b"accept")
 
             success_media_type = negotiate_api_media_type(accept) if has_success_representation else None
             if has_success_representation and success_media_type is None:
@@ -206,9 +208,7 @@ class CBORRoute(APIRoute):
                     cbor_body = cbor2.dumps(data, datetime_as_timestamp=True, timezone=UTC)
                     # Exclude content-type and content-length from headers
                     # (will be set by Response based on media_type and content)
-                    headers = {
-                        k: v for k, v in response.headers.items() if k.lower() not in ("content-type", "content-length")
-                    }
+                    headers = {k: v for k, v in response.headers.items() if k not in ("content-type", "content-length")}
                     return Response(
                         content=cbor_body,
                         status_code=response.status_code,
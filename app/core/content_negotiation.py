@@ -7,6 +7,7 @@ is best effort: it preserves the original error status and falls back to RFC
 """
 
 import re
+from functools import lru_cache
 
 CBOR_MEDIA_TYPE = "application/cbor"
 JSON_MEDIA_TYPE = "application/json"
@@ -18,13 +19,19 @@ ALLOWED_CONTENT_TYPES = frozenset({JSON_MEDIA_TYPE, CBOR_MEDIA_TYPE})
 _QVALUE_PATTERN = re.compile(r"(?:0(?:\.[0-9]{0,3})?|1(?:\.0{0,3})?)\Z")
 _EXACT_MEDIA_RANGE_SPECIFICITY = 2
 _MEDIA_TYPE_PARTS = 2
+_NORMALIZED_MEDIA_TYPE_CACHE_SIZE = 128
+_PARSED_ACCEPT_CACHE_SIZE = 128
 
 
+@lru_cache(maxsize=_NORMALIZED_MEDIA_TYPE_CACHE_SIZE)
 def normalize_media_type(media_type: str) -> str:
     """
     Normalize a media type for case-insensitive comparison.
+
+    Clients send a small, repetitive set of media types, so results are cached.
+    The cache is bounded because the input comes from request headers.
     """
-    return media_type.split(";", maxsplit=1)[0].strip().lower()
+    return media_type.partition(";")[0].strip().lower()
 
 
 def _parse_qvalue(params: list[str]) -> float | None:
@@ -54,6 +61,30 @@ def _parse_qvalue(params: list[str]) -> float | None:
     return None if has_media_parameter else quality
 
 
+@lru_cache(maxsize=_PARSED_ACCEPT_CACHE_SIZE)
+def _parse_accept(accept_header: str) -> tuple[tuple[str, float], ...]:
+    """
+    Parse an Accept header into normalized (media range, quality) pairs.
+
+    Ranges with an invalid quality, an unsupported parameter, or no subtype are
+    dropped. Results are cached per raw header so repeated negotiation against
+    the same request, or the same client, parses it only once.
+    """
+    ranges: list[tuple[str, float]] = []
+    for raw_item in accept_header.split(","):
+        item = raw_item.strip()
+        if not item:
+            continue
+
+        parts = item.split(";")
+        range_type = normalize_media_type(parts[0])
+        quality = _parse_qvalue(parts[1:])
+        if quality is None or "/" not in range_type:
+            continue
+        ranges.append((range_type, quality))
+    return tuple(ranges)
+
+
 def _media_range_specificity(range_type: str, target: str, target_parts: list[str]) -> int | None:
     """
     Return the RFC 9110 specificity of a matching media range.
@@ -83,17 +114,7 @@ def _media_type_quality(accept_header: str, media_type: str, *, explicit_only: b
     best_specificity = -1
     best_quality = 0.0
 
-    for raw_item in accept_header.split(","):
-        item = raw_item.strip()
-        if not item:
-            continue
-
-        parts = item.split(";")
-        range_type = normalize_media_type(parts[0])
-        quality = _parse_qvalue(parts[1:])
-        if quality is None or "/" not in range_type:
-            continue
-
+    for range_type, quality in _parse_accept(accept_header):
         specificity = _media_range_specificity(range_type, target, target_parts)
         if specificity is None or (explicit_only and specificity < _EXACT_MEDIA_RANGE_SPECIFICITY):
             continue
@@ -106,6 +127,16 @@ def _media_type_quality(accept_header: str, media_type: str, *, explicit_only: b
     return best_quality if best_specificity >= 0 else None
 
 
+def _mentions_cbor(accept_header: str) -> bool:
+    """
+    Return whether an Accept header could explicitly list the CBOR media type.
+
+    A cheap substring check run before the full parse, for the common case of
+    clients that only ever ask for JSON or wildcards.
+    """
+    return "cbor" in accept_header.lower()
+
+
 def accepts_media_type(accept_header: str, media_type: str, *, explicit_only: bool = False) -> bool:
     """
     Return whether an Accept header permits a media type.
@@ -150,8 +181,10 @@ def negotiate_api_media_type(accept_header: str, *, allow_cbor: bool = True) ->
     Select an API success representation.
 
     JSON is the default and wins ties. CBOR is optional and must be requested
-    explicitly; wildcards never opt a client into the binary representation.
+    explicitly; wildcards never opt a client into the binary representation,
+    so an Accept header that never names CBOR skips ranking it altogether.
     """
+    allow_cbor = allow_cbor and _mentions_cbor(accept_header)
     available = (JSON_MEDIA_TYPE, CBOR_MEDIA_TYPE) if allow_cbor else (JSON_MEDIA_TYPE,)
     explicit_only = frozenset({CBOR_MEDIA_TYPE}) if allow_cbor else frozenset()
     return negotiate_media_type(
@@ -170,6 +203,9 @@ def negotiate_problem_media_type(accept_header: str) -> str:
     in Accept. CBOR is used only when application/cbor is explicitly preferred;
     otherwise JSON Problem Details is the interoperable fallback.
     """
+    if not _mentions_cbor(accept_header):
+        return PROBLEM_JSON_MEDIA_TYPE
+
     explicit_problem_json_quality = _media_type_quality(
         accept_header,
         PROBLEM_JSON_MEDIA_TYPE,
@@ -4,6 +4,7 @@ Custom validation error handler for structured error format.
 
 import math
 from collections.abc import Sequence
+from functools import lru_cache
 from typing import Any
 
 from fastapi.exceptions import RequestValidationError
@@ -25,12 +26,14 @@ SENSITIVE_FIELD_NAMES = frozenset(
         "private_key",
     }
 )
-_SENSITIVE_FIELD_MARKERS = tuple(name.replace("_", "") for name in SENSITIVE_FIELD_NAMES)
+_SENSITIVE_FIELD_MARKERS = frozenset(name.replace("_", "") for name in SENSITIVE_FIELD_NAMES)
 _MIN_SENSITIVE_COMPOSITE_MARKER_LENGTH = 5
 _SENSITIVE_COMPOSITE_MARKERS = tuple(
     marker for marker in _SENSITIVE_FIELD_MARKERS if len(marker) >= _MIN_SENSITIVE_COMPOSITE_MARKER_LENGTH
 )
 _MAX_EXPOSED_VALUE_LENGTH = 200
+_SENSITIVE_SEGMENT_CACHE_SIZE = 128
+_FIELD_LOC_LENGTH = 2
 
 
 def loc_to_dot_notation(loc: Sequence[str | int]) -> str:
@@ -41,6 +44,11 @@ def loc_to_dot_notation(loc: Sequence[str | int]) -> str:
         ('body', 'email') -> 'body.email'
         ('body', 'items', 0, 'name') -> 'body.items[0].name'
     """
+    # Most locations are ("body", field) or a lone name; skip the join for those.
+    if len(loc) == _FIELD_LOC_LENGTH and isinstance(loc[0], str) and isinstance(loc[1], str):
+        return f"{loc[0]}.{loc[1]}"
+    if len(loc) == 1 and isinstance(loc[0], str):
+        return loc[0]
     parts: list[str] = []
     for segment in loc:
         if isinstance(segment, int):
@@ -52,19 +60,25 @@ def loc_to_dot_notation(loc: Sequence[str | int]) -> str:
     return "".join(parts)
 
 
+@lru_cache(maxsize=_SENSITIVE_SEGMENT_CACHE_SIZE)
+def _is_sensitive_segment(segment: str) -> bool:
+    """
+    Check whether one location segment names a sensitive field.
+
+    Error locations repeat the same field names, so decisions are cached. The
+    cache is bounded because unknown keys in a request body reach it too.
+    """
+    normalized = "".join(character for character in segment.lower() if character.isalnum())
+    return normalized in _SENSITIVE_FIELD_MARKERS or any(
+        marker in normalized for marker in _SENSITIVE_COMPOSITE_MARKERS
+    )
+
+
 def is_sensitive_field(loc: Sequence[str | int]) -> bool:
     """
     Check if any segment of the location path is a sensitive field.
     """
-    for segment in loc:
-        if not isinstance(segment, str):
-            continue
-        normalized = "".join(character for character in segment.lower() if character.isalnum())
-        if normalized in _SENSITIVE_FIELD_MARKERS or any(
-            marker in normalized for marker in _SENSITIVE_COMPOSITE_MARKERS
-        ):
-            return True
-    return False
+    return any(isinstance(segment, str) and _is_sensitive_segment(segment) for segment in loc)
 
 
 def is_safe_validation_value(value: object) -> bool:
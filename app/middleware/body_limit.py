@@ -27,8 +27,12 @@ class BodySizeLimitMiddleware:
             await self.app(scope, receive, send)
             return
 
-        headers = {k.decode("latin1").lower(): v.decode("latin1") for k, v in scope.get("headers", [])}
-        content_length = headers.get("content-length")
+        # ASGI header names are lowercase bytes, and int() parses the raw value. The last
+        # Content-Length field wins when a request repeats it.
+        content_length = None
+        for key, value in scope.get("headers", []):
+            if key == b"content-length":
+                content_length = value
         try:
             declared_size = int(content_length) if content_length is not None else None
         except ValueError:
@@ -71,7 +75,7 @@ class BodySizeLimitMiddleware:
         await self.app(scope, replay_receive, send)
 
     async def _send_body_rejection(self, send: Send, scope: Scope) -> None:
-        accept = ",".join(value.decode("latin1") for key, value in scope.get("headers", []) if key.lower() == b"accept")
+        accept = ",".join(value.decode("latin1") for key, value in scope.get("headers", []) if key == b"accept")
         response_media_type = negotiate_problem_media_type(accept)
         status_code = 413
         problem = {
@@ -3,14 +3,28 @@ Starlette app utilities for isolated middleware tests.
 """
 
 from collections.abc import Awaitable, Callable, Iterable, Sequence
+from dataclasses import dataclass
 from typing import Any
 
 from starlette.applications import Starlette
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message
 
 type RouteHandler = Callable[..., Awaitable[Any]]
 type MiddlewareSpec = tuple[type, dict[str, Any]]
 
 
+@dataclass(frozen=True, slots=True)
+class ASGIResponse:
+    """
+    Response captured from a direct ASGI call.
+    """
+
+    status_code: int
+    headers: Headers
+    body: bytes
+
+
 def build_starlette_app(
     routes: Sequence[tuple[str, RouteHandler, Sequence[str]]],
     middleware: Iterable[MiddlewareSpec] | None = None,
@@ -31,4 +45,46 @@ def build_starlette_app(
     return app
 
 
-__all__ = ["build_starlette_app"]
+async def call_asgi(
+    app: ASGIApp,
+    path: str,
+    method: str = "GET",
+    *,
+    scheme: str = "http",
+) -> ASGIResponse:
+    """
+    Send one bodiless HTTP request straight to an ASGI app and capture the response.
+
+    Skips the HTTP client, transport, and lifespan entirely; use it for response-shape
+    assertions on apps without startup or shutdown handlers.
+    """
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": scheme,
+        "path": path,
+        "raw_path": path.encode("latin1"),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "client": ("testclient", 50000),
+        "server": ("testserver", 443 if scheme == "https" else 80),
+    }
+    messages: list[Message] = []
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        messages.append(message)
+
+    await app(scope, receive, send)
+
+    start = next(message for message in messages if message["type"] == "http.response.start")
+    body = b"".join(message.get("body", b"") for message in messages if message["type"] == "http.response.body")
+    return ASGIResponse(status_code=start["status"], headers=Headers(raw=start.get("headers", [])), body=body)
+
+
+__all__ = ["ASGIResponse", "build_starlette_app", "call_asgi"]
@@ -8,6 +8,7 @@ import cbor2
 import pytest
 from fastapi.testclient import TestClient
 
+from app.core.content_negotiation import JSON_MEDIA_TYPE
 from tests.helpers.profiles import make_profile, make_profile_payload_dict
 
 BASE_URL = "/v1/profile"
@@ -159,7 +160,7 @@ class TestCBORResponse:
         )
 
         assert response.status_code == 200
-        assert "application/json" in response.headers["content-type"]
+        assert response.headers["content-type"].startswith(JSON_MEDIA_TYPE)
         body = response.json()
         assert set(body) == PROFILE_FIELD_NAMES
 
@@ -177,7 +178,7 @@ class TestCBORResponse:
         response = client.get(BASE_URL)
 
         assert response.status_code == 200
-        assert "application/json" in response.headers["content-type"]
+        assert response.headers["content-type"].startswith(JSON_MEDIA_TYPE)
 
     def test_repeated_accept_fields_are_combined(
         self,
@@ -6,6 +6,8 @@ import cbor2
 import pytest
 from fastapi.testclient import TestClient
 
+from app.core.content_negotiation import JSON_MEDIA_TYPE
+
 
 class TestHelloGet:
     """Tests for GET /hello/."""
@@ -42,7 +44,7 @@ class TestHelloGet:
         """Verify GET /hello/ returns JSON content type."""
         response = client.get("/v1/hello")
 
-        assert "application/json" in response.headers.get("content-type", "")
+        assert response.headers["content-type"].startswith(JSON_MEDIA_TYPE)
 
     def test_accepts_cbor_negotiation(self, client: TestClient) -> None:
         """Verify GET /hello/ returns CBOR when requested."""
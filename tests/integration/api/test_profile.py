@@ -2,6 +2,7 @@
 Integration tests for profile endpoints.
 """
 
+import json
 from unittest.mock import AsyncMock
 
 import pytest
@@ -11,6 +12,8 @@ from app.exceptions import ProfileAlreadyExistsError, ProfileNotFoundError
 from tests.helpers.profiles import make_profile, make_profile_payload_dict
 
 BASE_URL = "/v1/profile"
+PROFILE_BODY = json.dumps(make_profile_payload_dict()).encode()
+JSON_HEADERS = {"Content-Type": "application/json"}
 PROFILE_FIELD_NAMES = {
     "id",
     "first_name",
@@ -40,7 +43,7 @@ class TestCreateProfile:
         """
         mock_profile_service.create_profile.return_value = make_profile()
 
-        response = client.post(BASE_URL, json=make_profile_payload_dict())
+        response = client.post(BASE_URL, content=PROFILE_BODY, headers=JSON_HEADERS)
 
         assert response.status_code == 201
         body = response.json()
@@ -60,7 +63,7 @@ class TestCreateProfile:
         """
         mock_profile_service.create_profile.return_value = make_profile()
 
-        response = client.post(BASE_URL, json=make_profile_payload_dict())
+        response = client.post(BASE_URL, content=PROFILE_BODY, headers=JSON_HEADERS)
 
         body = response.json()
         assert "$schema" not in body
@@ -76,7 +79,7 @@ class TestCreateProfile:
         """
         mock_profile_service.create_profile.return_value = make_profile()
 
-        response = client.post(BASE_URL, json=make_profile_payload_dict())
+        response = client.post(BASE_URL, content=PROFILE_BODY, headers=JSON_HEADERS)
 
         link = response.headers.get("link", "")
         assert 'rel="describedBy"' in link
@@ -93,7 +96,7 @@ class TestCreateProfile:
         """
         mock_profile_service.create_profile.side_effect = ProfileAlreadyExistsError()
 
-        response = client.post(BASE_URL, json=make_profile_payload_dict())
+        response = client.post(BASE_URL, content=PROFILE_BODY, headers=JSON_HEADERS)
 
         assert response.status_code == 409
         assert response.json()["title"] == "Profile already exists"
@@ -109,23 +112,11 @@ class TestCreateProfile:
         """
         mock_profile_service.create_profile.side_effect = RuntimeError("Database connection failed")
 
-        response = client.post(BASE_URL, json=make_profile_payload_dict())
+        response = client.post(BASE_URL, content=PROFILE_BODY, headers=JSON_HEADERS)
 
         assert response.status_code == 500
         assert response.json()["detail"] == "Failed to create profile"
 
-    def test_returns_401_without_auth(
-        self,
-        client: TestClient,
-        mock_profile_service: AsyncMock,
-    ) -> None:
-        """
-        Verify unauthenticated request returns 401.
-        """
-        response = client.post(BASE_URL, json=make_profile_payload_dict())
-
-        assert response.status_code == 401
-
     def test_returns_422_with_invalid_email(
         self,
         client: TestClient,
@@ -175,8 +166,8 @@ class TestCreateProfile:
         response = client.post(BASE_URL, json=payload)
 
         assert response.status_code == 422
-        body = response.json()
-        assert any(missing_field in str(err.get("location", "")) for err in body["errors"])
+        errors_by_location = {err["location"]: err for err in response.json()["errors"]}
+        assert f"body.{missing_field}" in errors_by_location
 
     def test_returns_422_when_terms_false(
         self,
@@ -192,9 +183,8 @@ class TestCreateProfile:
         response = client.post(BASE_URL, json=payload)
 
         assert response.status_code == 422
-        body = response.json()
-        assert any("terms" in str(err.get("location", "")) for err in body["errors"])
-        assert any("terms must be accepted" in str(err.get("message", "")) for err in body["errors"])
+        errors_by_location = {err["location"]: err for err in response.json()["errors"]}
+        assert "terms must be accepted" in errors_by_location["body.terms"]["message"]
 
 
 class TestGetProfile:
@@ -286,18 +276,6 @@ class TestGetProfile:
         assert response.status_code == 500
         assert response.json()["detail"] == "Failed to retrieve profile"
 
-    def test_returns_401_without_auth(
-        self,
-        client: TestClient,
-        mock_profile_service: AsyncMock,
-    ) -> None:
-        """
-        Verify unauthenticated request returns 401.
-        """
-        response = client.get(BASE_URL)
-
-        assert response.status_code == 401
-
 
 class TestUpdateProfile:
     """
@@ -387,18 +365,6 @@ class TestUpdateProfile:
         assert response.status_code == 500
         assert response.json()["detail"] == "Failed to update profile"
 
-    def test_returns_401_without_auth(
-        self,
-        client: TestClient,
-        mock_profile_service: AsyncMock,
-    ) -> None:
-        """
-        Verify unauthenticated request returns 401.
-        """
-        response = client.patch(BASE_URL, json={"first_name": "Updated"})
-
-        assert response.status_code == 401
-
     def test_allows_partial_update(
         self,
         client: TestClient,
@@ -531,15 +497,32 @@ class TestDeleteProfile:
         assert response.status_code == 500
         assert response.json()["detail"] == "Failed to delete profile"
 
+
+class TestProfileAuthentication:
+    """
+    Tests for unauthenticated access to /profile/.
+    """
+
+    @pytest.mark.parametrize(
+        ("method", "payload"),
+        [
+            ("POST", make_profile_payload_dict()),
+            ("GET", None),
+            ("PATCH", {"first_name": "Updated"}),
+            ("DELETE", None),
+        ],
+    )
     def test_returns_401_without_auth(
         self,
         client: TestClient,
         mock_profile_service: AsyncMock,
+        method: str,
+        payload: dict[str, object] | None,
     ) -> None:
         """
-        Verify unauthenticated request returns 401.
+        Verify unauthenticated requests return 401 for every profile operation.
         """
-        response = client.delete(BASE_URL)
+        response = client.request(method, BASE_URL, json=payload)
 
         assert response.status_code == 401
 
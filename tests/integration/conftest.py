@@ -10,6 +10,7 @@ from collections.abc import Generator
 from unittest.mock import AsyncMock, patch
 
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 os.environ["ENVIRONMENT"] = "test"
@@ -31,16 +32,14 @@ def mock_profile_service() -> AsyncMock:
     return AsyncMock(spec=ProfileService)
 
 
-@pytest.fixture
-def client(mock_profile_service: AsyncMock) -> Generator[TestClient]:
+@pytest.fixture(scope="session")
+def app_client() -> Generator[tuple[TestClient, FastAPI]]:
     """
-    TestClient with mocked services (no Firebase/Firestore).
+    Session-wide TestClient whose lifespan runs once (no Firebase/Firestore).
 
-    - Imports app inside fixture to get current module state (avoids stale references
-      if other tests delete/reimport app.main).
-    - Patches Firebase initialization to avoid real connections.
-    - Injects mock_profile_service via dependency_overrides.
-    - Clears all overrides after the test.
+    - Yields the client together with the FastAPI app it serves, so overrides are
+      installed on that app even if other tests delete/reimport app.main later.
+    - Patches Firebase initialization and logging setup for the single startup and shutdown.
     """
     from app.main import app, fastapi_app
 
@@ -48,15 +47,28 @@ def client(mock_profile_service: AsyncMock) -> Generator[TestClient]:
         patch("app.main.initialize_firebase"),
         patch("app.main.configure_logging"),
         patch("app.main.close_async_firestore_client"),
-    ):
-        fastapi_app.dependency_overrides[get_profile_service] = lambda: mock_profile_service
-        with TestClient(
+        TestClient(
             app,
             raise_server_exceptions=False,
             client=("203.0.113.10", 50000),
-        ) as c:
-            yield c
-        fastapi_app.dependency_overrides.clear()
+        ) as c,
+    ):
+        yield c, fastapi_app
+
+
+@pytest.fixture
+def client(app_client: tuple[TestClient, FastAPI], mock_profile_service: AsyncMock) -> Generator[TestClient]:
+    """
+    TestClient with mocked services (no Firebase/Firestore).
+
+    - Reuses the session-wide client so the app lifespan is not re-entered per test.
+    - Injects mock_profile_service via dependency_overrides.
+    - Clears all overrides after the test.
+    """
+    test_client, fastapi_app = app_client
+    fastapi_app.dependency_overrides[get_profile_service] = lambda: mock_profile_service
+    yield test_client
+    fastapi_app.dependency_overrides.clear()
 
 
 @pytest.fixture
@@ -68,11 +80,11 @@ def fake_user() -> FirebaseUser:
 
 
 @pytest.fixture
-def with_fake_user(fake_user: FirebaseUser) -> Generator[None]:
+def with_fake_user(app_client: tuple[TestClient, FastAPI], fake_user: FirebaseUser) -> Generator[None]:
     """
-    Override auth to return fake user.
+    Override auth to return fake user on the app served by the session client.
     """
-    from app.main import fastapi_app
+    _, fastapi_app = app_client
 
     fastapi_app.dependency_overrides[verify_firebase_token] = lambda: fake_user
     yield
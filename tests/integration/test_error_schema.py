@@ -41,36 +41,34 @@ class TestErrorSchemaDiscovery:
         assert response.status_code == 401
         assert_schema_link(response.json(), response.headers["link"], PROBLEM_SCHEMA_PATH)
 
-    def test_404_uses_problem_schema(
+    @pytest.mark.parametrize(
+        ("method", "payload", "service_method", "error", "status_code"),
+        [
+            ("GET", None, "get_profile", ProfileNotFoundError(), 404),
+            ("POST", make_profile_payload_dict(), "create_profile", ProfileAlreadyExistsError(), 409),
+            ("GET", None, "get_profile", RuntimeError("Database failure"), 500),
+        ],
+        ids=["not_found", "conflict", "unexpected"],
+    )
+    def test_service_error_uses_problem_schema(
         self,
         client: TestClient,
         with_fake_user: None,
         mock_profile_service: AsyncMock,
+        method: str,
+        payload: dict[str, object] | None,
+        service_method: str,
+        error: Exception,
+        status_code: int,
     ) -> None:
         """
-        Verify not-found failures advertise the generic problem schema.
+        Verify domain and unexpected service failures advertise the generic problem schema.
         """
-        mock_profile_service.get_profile.side_effect = ProfileNotFoundError()
+        getattr(mock_profile_service, service_method).side_effect = error
 
-        response = client.get(BASE_URL)
+        response = client.request(method, BASE_URL, json=payload)
 
-        assert response.status_code == 404
-        assert_schema_link(response.json(), response.headers["link"], PROBLEM_SCHEMA_PATH)
-
-    def test_409_uses_problem_schema(
-        self,
-        client: TestClient,
-        with_fake_user: None,
-        mock_profile_service: AsyncMock,
-    ) -> None:
-        """
-        Verify conflict failures advertise the generic problem schema.
-        """
-        mock_profile_service.create_profile.side_effect = ProfileAlreadyExistsError()
-
-        response = client.post(BASE_URL, json=make_profile_payload_dict())
-
-        assert response.status_code == 409
+        assert response.status_code == status_code
         assert_schema_link(response.json(), response.headers["link"], PROBLEM_SCHEMA_PATH)
 
     def test_422_uses_validation_schema(self, client: TestClient, with_fake_user: None) -> None:
@@ -81,19 +79,3 @@ class TestErrorSchemaDiscovery:
 
         assert response.status_code == 422
         assert_schema_link(response.json(), response.headers["link"], VALIDATION_PROBLEM_SCHEMA_PATH)
-
-    def test_500_uses_problem_schema(
-        self,
-        client: TestClient,
-        with_fake_user: None,
-        mock_profile_service: AsyncMock,
-    ) -> None:
-        """
-        Verify unexpected failures advertise the generic problem schema.
-        """
-        mock_profile_service.get_profile.side_effect = RuntimeError("Database failure")
-
-        response = client.get(BASE_URL)
-
-        assert response.status_code == 500
-        assert_schema_link(response.json(), response.headers["link"], PROBLEM_SCHEMA_PATH)
@@ -2,8 +2,6 @@
 Firebase-related mocks used across tests.
 """
 
-from unittest.mock import MagicMock
-
 from pytest import MonkeyPatch
 
 
@@ -47,11 +45,14 @@ def patch_firebase_verify_error(monkeypatch: MonkeyPatch, error: Exception) -> N
 
 def patch_get_firebase_app(monkeypatch: MonkeyPatch) -> None:
     """
-    Patch get_firebase_app to return a MagicMock app instance.
+    Patch get_firebase_app to return a placeholder app instance.
+
+    The patched verify_id_token never inspects the app, so a plain sentinel suffices.
     """
     import app.auth.firebase as auth_mod
 
-    monkeypatch.setattr(auth_mod, "get_firebase_app", MagicMock)
+    app = object()
+    monkeypatch.setattr(auth_mod, "get_firebase_app", lambda: app)
 
 
 def patch_router_verify_to_raise(monkeypatch: MonkeyPatch, exc: Exception) -> None:
@@ -2,7 +2,9 @@
 Unit tests for Firebase authentication.
 """
 
-from typing import Any, cast
+import logging
+from collections.abc import Generator
+from typing import Any, cast, override
 
 import pytest
 from fastapi import HTTPException
@@ -23,6 +25,39 @@ from tests.mocks.firebase import (
     patch_get_firebase_app,
 )
 
+AUTH_LOGGER = "app.auth.firebase"
+
+
+class _RecordingHandler(logging.Handler):
+    """
+    Collect emitted records without formatting them.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(logging.DEBUG)
+        self.records: list[logging.LogRecord] = []
+
+    @override
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+@pytest.fixture
+def auth_log_records() -> Generator[list[logging.LogRecord]]:
+    """
+    Capture records emitted by the auth logger at DEBUG and above.
+    """
+    logger = logging.getLogger(AUTH_LOGGER)
+    handler = _RecordingHandler()
+    previous_level = logger.level
+    logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG)
+    try:
+        yield handler.records
+    finally:
+        logger.removeHandler(handler)
+        logger.setLevel(previous_level)
+
 
 def _make_credentials(token: str = "test-token") -> HTTPAuthorizationCredentials:
     """
@@ -83,100 +118,50 @@ class TestVerifyFirebaseToken:
         assert user.email == "user@example.com"
         assert user.email_verified is True
 
-    async def test_expired_token_raises_401(self, monkeypatch: MonkeyPatch) -> None:
+    @pytest.mark.parametrize(
+        "error",
+        [
+            ExpiredIdTokenError("Token expired", None),
+            RevokedIdTokenError("Token revoked"),
+            InvalidIdTokenError("Invalid token"),
+            UserDisabledError("User disabled"),
+        ],
+        ids=["expired", "revoked", "invalid", "disabled"],
+    )
+    async def test_credential_error_raises_401(self, monkeypatch: MonkeyPatch, error: Exception) -> None:
         """
-        Verify expired token raises HTTPException with 401.
+        Verify rejected credentials raise HTTPException with 401.
         """
         patch_get_firebase_app(monkeypatch)
-        patch_firebase_verify_error(monkeypatch, ExpiredIdTokenError("Token expired", None))
-
-        credentials = _make_credentials("expired-token")
+        patch_firebase_verify_error(monkeypatch, error)
 
         with pytest.raises(HTTPException) as exc_info:
-            await verify_firebase_token(credentials)
+            await verify_firebase_token(_make_credentials("rejected-token"))
 
         assert exc_info.value.status_code == 401
         assert exc_info.value.detail == "Unauthorized"
         assert exc_info.value.headers == {"WWW-Authenticate": "Bearer"}
 
-    async def test_revoked_token_raises_401(self, monkeypatch: MonkeyPatch) -> None:
-        """
-        Verify revoked token raises HTTPException with 401.
-        """
-        patch_get_firebase_app(monkeypatch)
-        patch_firebase_verify_error(monkeypatch, RevokedIdTokenError("Token revoked"))
-
-        credentials = _make_credentials("revoked-token")
-
-        with pytest.raises(HTTPException) as exc_info:
-            await verify_firebase_token(credentials)
-
-        assert exc_info.value.status_code == 401
-        assert exc_info.value.detail == "Unauthorized"
-
-    async def test_invalid_token_raises_401(self, monkeypatch: MonkeyPatch) -> None:
-        """
-        Verify invalid token raises HTTPException with 401.
-        """
-        patch_get_firebase_app(monkeypatch)
-        patch_firebase_verify_error(monkeypatch, InvalidIdTokenError("Invalid token"))
-
-        credentials = _make_credentials("invalid-token")
-
-        with pytest.raises(HTTPException) as exc_info:
-            await verify_firebase_token(credentials)
-
-        assert exc_info.value.status_code == 401
-        assert exc_info.value.detail == "Unauthorized"
-
-    async def test_disabled_user_raises_401(self, monkeypatch: MonkeyPatch) -> None:
-        """
-        Verify disabled user raises HTTPException with 401.
-        """
-        patch_get_firebase_app(monkeypatch)
-        patch_firebase_verify_error(monkeypatch, UserDisabledError("User disabled"))
-
-        credentials = _make_credentials("disabled-user-token")
-
-        with pytest.raises(HTTPException) as exc_info:
-            await verify_firebase_token(credentials)
-
-        assert exc_info.value.status_code == 401
-        assert exc_info.value.detail == "Unauthorized"
-
-    async def test_generic_error_raises_503(self, monkeypatch: MonkeyPatch) -> None:
-        """
-        Verify unexpected authentication failures report dependency unavailability.
-        """
-        patch_get_firebase_app(monkeypatch)
-        patch_firebase_verify_error(monkeypatch, RuntimeError("Unexpected error"))
-
-        credentials = _make_credentials("error-token")
-
-        with pytest.raises(HTTPException) as exc_info:
-            await verify_firebase_token(credentials)
-
-        assert exc_info.value.status_code == 503
-        assert exc_info.value.detail == "Authentication service temporarily unavailable"
-        assert exc_info.value.headers == {"Retry-After": "30"}
-
-    async def test_certificate_fetch_error_raises_503(self, monkeypatch: MonkeyPatch) -> None:
+    @pytest.mark.parametrize(
+        "error",
+        [
+            RuntimeError("Unexpected error"),
+            CertificateFetchError("Failed to fetch certificates", cause=None),
+        ],
+        ids=["unexpected", "certificate_fetch"],
+    )
+    async def test_dependency_error_raises_503(self, monkeypatch: MonkeyPatch, error: Exception) -> None:
         """
-        Verify CertificateFetchError raises HTTPException with 503.
+        Verify verification dependency failures raise HTTPException with 503.
 
-        This occurs when Firebase SDK cannot fetch public keys for token verification
-        due to network issues or configuration problems.
+        CertificateFetchError occurs when Firebase SDK cannot fetch public keys for token
+        verification due to network issues or configuration problems.
         """
         patch_get_firebase_app(monkeypatch)
-        patch_firebase_verify_error(
-            monkeypatch,
-            CertificateFetchError("Failed to fetch certificates", cause=None),
-        )
-
-        credentials = _make_credentials("valid-token")
+        patch_firebase_verify_error(monkeypatch, error)
 
         with pytest.raises(HTTPException) as exc_info:
-            await verify_firebase_token(credentials)
+            await verify_firebase_token(_make_credentials("valid-token"))
 
         assert exc_info.value.status_code == 503
         assert exc_info.value.detail == "Authentication service temporarily unavailable"
@@ -228,33 +213,28 @@ class TestVerifyFirebaseTokenLogging:
     """
 
     async def test_successful_auth_logs_at_debug_level(
-        self, monkeypatch: MonkeyPatch, caplog: pytest.LogCaptureFixture
+        self, monkeypatch: MonkeyPatch, auth_log_records: list[logging.LogRecord]
     ) -> None:
         """
         Verify successful authentication logs at DEBUG level, not INFO.
         """
-        import logging
-
         patch_get_firebase_app(monkeypatch)
         patch_firebase_verify_ok(monkeypatch, uid="user-123")
 
         credentials = _make_credentials("valid-token")
 
-        with caplog.at_level(logging.DEBUG):
-            await verify_firebase_token(credentials)
+        await verify_firebase_token(credentials)
 
-        auth_logs = [r for r in caplog.records if "Successfully authenticated" in r.message]
-        assert len(auth_logs) == 1
-        assert auth_logs[0].levelno == logging.DEBUG
+        assert [(r.levelno, r.getMessage()) for r in auth_log_records] == [
+            (logging.DEBUG, "Successfully authenticated user")
+        ]
 
     async def test_missing_uid_logs_at_warning_level(
-        self, monkeypatch: MonkeyPatch, caplog: pytest.LogCaptureFixture
+        self, monkeypatch: MonkeyPatch, auth_log_records: list[logging.LogRecord]
     ) -> None:
         """
         Verify missing UID logs at WARNING level.
         """
-        import logging
-
         patch_get_firebase_app(monkeypatch)
 
         import app.auth.firebase as auth_mod
@@ -266,12 +246,12 @@ class TestVerifyFirebaseTokenLogging:
 
         credentials = _make_credentials("no-uid-token")
 
-        with caplog.at_level(logging.DEBUG), pytest.raises(HTTPException):
+        with pytest.raises(HTTPException):
             await verify_firebase_token(credentials)
 
-        warning_logs = [r for r in caplog.records if "missing user ID" in r.message]
-        assert len(warning_logs) == 1
-        assert warning_logs[0].levelno == logging.WARNING
+        assert [(r.levelno, r.getMessage()) for r in auth_log_records] == [
+            (logging.WARNING, "Invalid token: missing user ID")
+        ]
 
 
 class TestHTTPBearerSecurity:
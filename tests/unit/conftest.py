@@ -5,8 +5,9 @@ Unit tests should not use the `client` fixture (TestClient with real app).
 They test isolated functions/classes with mocked dependencies.
 """
 
+import asyncio
 import os
-from collections.abc import Generator
+from collections.abc import Callable, Generator
 
 import pytest
 
@@ -17,13 +18,34 @@ os.environ["CORS_ORIGINS"] = ""
 
 from app.core.config import get_settings
 
+LOOP_FACTORIES: dict[str, Callable[[], asyncio.AbstractEventLoop]]
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is not installed on Windows, Cygwin or PyPy
+    LOOP_FACTORIES = {"asyncio": asyncio.new_event_loop}
+else:
+    LOOP_FACTORIES = {"uvloop": uvloop.new_event_loop}
 
-@pytest.fixture(autouse=True)
-def reset_settings_cache() -> Generator[None]:
+
+def pytest_asyncio_loop_factories(
+    config: pytest.Config, item: pytest.Item
+) -> dict[str, Callable[[], asyncio.AbstractEventLoop]]:
+    """
+    Run async unit tests on uvloop, the event loop Uvicorn uses in production.
+
+    Falls back to the default asyncio loop where uvloop is not installed. Combined with
+    the session loop scope in pyproject.toml, one loop serves every async test.
+    """
+    return LOOP_FACTORIES
+
+
+@pytest.fixture
+def fresh_settings() -> Generator[None]:
     """
-    Reset settings cache before and after each unit test.
+    Reset the settings cache before and after a test that re-reads the environment.
 
-    Ensures environment variable changes in tests don't leak.
+    Opt in only where a test changes settings-related environment variables and
+    then calls get_settings(); other tests keep the warm cache.
     """
     get_settings.cache_clear()
     yield
@@ -3,12 +3,14 @@ Unit tests for CBOR serialization support.
 """
 
 import json
-from collections.abc import Callable
+from collections.abc import AsyncGenerator, Callable
 from typing import Any
 from unittest.mock import MagicMock
 
 import cbor2
+import httpx2
 import pytest
+from fastapi import APIRouter, FastAPI
 from starlette.datastructures import Headers
 from starlette.responses import JSONResponse
 
@@ -17,6 +19,7 @@ from app.core.cbor import (
     CBORDecodeHTTPException,
     CBORProblemPostHook,
     CBORRequest,
+    CBORRoute,
     UnsupportedMediaTypeHTTPException,
     UnsupportedMediaTypeProblem,
 )
@@ -331,7 +334,7 @@ class TestCBORRequestUpdateContentType:
         # New headers should contain application/json
         new_content_type = None
         for key, value in scope["headers"]:
-            if key.lower() == b"content-type":
+            if key == b"content-type":
                 new_content_type = value
                 break
         assert new_content_type == b"application/json"
@@ -358,104 +361,111 @@ class TestCBORRequestUpdateContentType:
         # Headers in scope should be updated
         new_content_type = None
         for key, value in scope["headers"]:
-            if key.lower() == b"content-type":
+            if key == b"content-type":
                 new_content_type = value
                 break
         assert new_content_type == b"application/json"
 
+    def test_update_content_type_keeps_header_order(self) -> None:
+        """
+        Verify the content-type entry is replaced in place and duplicates are dropped.
+        """
+        scope: dict[str, Any] = {
+            "type": "http",
+            "headers": [
+                (b"accept", b"application/cbor"),
+                (b"content-type", b"application/cbor"),
+                (b"x-request-id", b"abc"),
+                (b"content-type", b"application/cbor"),
+            ],
+        }
+
+        async def receive() -> dict[str, Any]:
+            return {"type": "http.request", "body": b""}
+
+        CBORRequest(scope, receive)._update_content_type_to_json()
+
+        assert scope["headers"] == [
+            (b"accept", b"application/cbor"),
+            (b"content-type", b"application/json"),
+            (b"x-request-id", b"abc"),
+        ]
+
+
+@pytest.fixture(scope="module")
+async def cbor_route_client() -> AsyncGenerator[httpx2.AsyncClient]:
+    """
+    Serve one CBORRoute app in-process for all route tests in this module.
+    """
+    router = APIRouter(route_class=CBORRoute)
+
+    @router.get("/test")
+    async def get_test() -> dict[str, str]:
+        return {"message": "hello"}
+
+    app = FastAPI()
+    app.include_router(router)
+
+    async with httpx2.AsyncClient(transport=httpx2.ASGITransport(app=app), base_url="http://testserver") as client:
+        yield client
+
 
 class TestCBORRoute:
     """Tests for CBORRoute handler."""
 
-    def test_no_accept_header_returns_json(self) -> None:
+    async def test_no_accept_header_returns_json(self, cbor_route_client: httpx2.AsyncClient) -> None:
         """
         Verify response remains JSON when Accept header is empty.
 
         This tests the path where Accept header is present but empty.
         """
-        from fastapi import APIRouter, FastAPI
-        from fastapi.testclient import TestClient
-
-        from app.core.cbor import CBORRoute
-
-        router = APIRouter(route_class=CBORRoute)
-
-        @router.get("/test")
-        async def get_test() -> dict[str, str]:
-            return {"message": "hello"}
-
-        app = FastAPI()
-        app.include_router(router)
-
-        # Create test client and manually construct request without Accept header
-        with TestClient(app, headers={}) as client:
-            # Override default headers by setting empty accept
-            response = client.get("/test", headers={"Accept": ""})
+        response = await cbor_route_client.get("/test", headers={"Accept": ""})
 
         assert response.status_code == 200
-        assert "application/json" in response.headers["content-type"]
+        assert response.headers["content-type"].startswith(JSON_MEDIA_TYPE)
         assert response.json() == {"message": "hello"}
 
-    def test_non_cbor_accept_returns_json_unchanged(self) -> None:
+    async def test_non_cbor_accept_returns_json_unchanged(self, cbor_route_client: httpx2.AsyncClient) -> None:
         """
         Verify JSON response when Accept header doesn't include CBOR.
 
         Tests the branch where CBOR_MEDIA_TYPE is not in accept header.
         """
-        from fastapi import APIRouter, FastAPI
-        from fastapi.testclient import TestClient
-
-        from app.core.cbor import CBORRoute
-
-        router = APIRouter(route_class=CBORRoute)
-
-        @router.get("/test")
-        async def get_test() -> dict[str, str]:
-            return {"message": "hello"}
-
-        app = FastAPI()
-        app.include_router(router)
-
-        with TestClient(app) as client:
-            # Explicitly request only JSON (no CBOR)
-            response = client.get("/test", headers={"Accept": "application/json"})
+        response = await cbor_route_client.get("/test", headers={"Accept": "application/json"})
 
         assert response.status_code == 200
-        assert "application/json" in response.headers["content-type"]
+        assert response.headers["content-type"].startswith(JSON_MEDIA_TYPE)
         assert response.json() == {"message": "hello"}
 
-    def test_no_accept_header_in_scope_returns_json(self) -> None:
+    async def test_no_accept_header_in_scope_returns_json(self, cbor_route_client: httpx2.AsyncClient) -> None:
         """
         Verify response remains JSON when no Accept header exists in scope.
 
         Tests the branch where the for loop exits without finding b"accept" key.
+        Sending a prebuilt request bypasses the client's default Accept header.
         """
-        import httpx2
-        from fastapi import APIRouter, FastAPI
-        from fastapi.testclient import TestClient
-
-        from app.core.cbor import CBORRoute
-
-        router = APIRouter(route_class=CBORRoute)
-
-        @router.get("/test")
-        async def get_test() -> dict[str, str]:
-            return {"message": "hello"}
+        request = httpx2.Request(
+            "GET",
+            "http://testserver/test",
+            headers=[("Host", "testserver"), ("User-Agent", "test")],
+        )
+        response = await cbor_route_client.send(request)
 
-        app = FastAPI()
-        app.include_router(router)
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith(JSON_MEDIA_TYPE)
 
-        with TestClient(app) as client:
-            # Send request with explicit headers that don't include Accept
-            req = httpx2.Request(
-                "GET",
-                "http://testserver/test",
-                headers=[("Host", "testserver"), ("User-Agent", "test")],
-            )
-            response = client._transport.handle_request(req)
+    async def test_accept_split_across_field_lines_is_joined(self, cbor_route_client: httpx2.AsyncClient) -> None:
+        """
+        Verify every Accept field line takes part in negotiation.
+        """
+        response = await cbor_route_client.get(
+            "/test",
+            headers=[("Accept", "application/json;q=0.1"), ("Accept", CBOR_MEDIA_TYPE)],
+        )
 
         assert response.status_code == 200
-        assert "application/json" in response.headers["content-type"]
+        assert response.headers["content-type"] == CBOR_MEDIA_TYPE
+        assert cbor2.loads(response.content) == {"message": "hello"}
 
 
 class TestNormalizeMediaType:
@@ -485,6 +495,10 @@ class TestNormalizeMediaType:
         assert normalize_media_type("application/json") == "application/json"
         assert normalize_media_type("application/cbor") == "application/cbor"
 
+    def test_cache_is_bounded(self) -> None:
+        """Header-derived inputs cannot grow the normalization cache without limit."""
+        assert normalize_media_type.cache_parameters()["maxsize"] == 128
+
 
 class TestAcceptsMediaType:
     """Tests for accepts_media_type function (RFC 9110 Section 12.5.1)."""
@@ -672,6 +686,18 @@ class TestNegotiateResponseMediaType:
         assert negotiate_problem_media_type("application/xml") == PROBLEM_JSON_MEDIA_TYPE
         assert negotiate_problem_media_type("application/problem+cbor") == PROBLEM_JSON_MEDIA_TYPE
 
+    @pytest.mark.parametrize(
+        "accept",
+        ["APPLICATION/CBOR", "application/json;q=0.5, Application/Cbor"],
+        ids=["upper", "mixed_list"],
+    )
+    def test_cbor_prefilter_is_case_insensitive(self, accept: str) -> None:
+        """
+        Verify the CBOR substring prefilter does not hide differently cased ranges.
+        """
+        assert negotiate_api_media_type(accept) == CBOR_MEDIA_TYPE
+        assert negotiate_problem_media_type(accept) == CBOR_MEDIA_TYPE
+
     def test_explicit_problem_json_exclusion_allows_cbor(self) -> None:
         """An exact exclusion overrides the application/json compatibility preference."""
         accept = "application/problem+json;q=0, application/json;q=1, application/cbor;q=0.5"
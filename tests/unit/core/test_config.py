@@ -3,6 +3,8 @@ Unit tests for configuration settings.
 """
 
 import os
+from collections.abc import Generator
+from pathlib import Path
 from typing import Any, cast
 
 import pytest
@@ -23,70 +25,79 @@ def _create_settings(**kwargs: Any) -> Settings:  # noqa: ANN401
     return cast("Any", Settings)(_env_file=None, **kwargs)
 
 
+SETTINGS_ENV_VARS = (
+    "ENVIRONMENT",
+    "LOG_LEVEL",
+    "FIREBASE_PROJECT_ID",
+    "GOOGLE_APPLICATION_CREDENTIALS",
+    "FIRESTORE_DATABASE",
+    "MAX_REQUEST_SIZE_BYTES",
+    "CORS_ORIGINS",
+)
+
+
 @pytest.fixture(autouse=True)
-def clear_settings_env(monkeypatch: pytest.MonkeyPatch) -> None:
+def clear_settings_env() -> Generator[None]:
     """
     Clear settings-related environment variables to test defaults.
 
     This ensures tests are isolated from the .env file and system environment.
+    Values are popped and restored directly; tests that set one of them use
+    monkeypatch, which is torn down first and removes it again.
     """
-    env_vars = [
-        "ENVIRONMENT",
-        "LOG_LEVEL",
-        "FIREBASE_PROJECT_ID",
-        "GOOGLE_APPLICATION_CREDENTIALS",
-        "FIRESTORE_DATABASE",
-        "MAX_REQUEST_SIZE_BYTES",
-        "CORS_ORIGINS",
-    ]
-    for var in env_vars:
-        monkeypatch.delenv(var, raising=False)
+    saved = {var: os.environ.pop(var, None) for var in SETTINGS_ENV_VARS}
+    yield
+    os.environ.update({var: value for var, value in saved.items() if value is not None})
 
 
-class TestParseCORSOrigins:
-    """
-    Tests for parse_cors_origins function.
+@pytest.fixture(scope="module")
+def default_settings() -> Settings:
     """
+    Build Settings from defaults once for the read-only default value tests.
 
-    def test_parses_json_array(self) -> None:
-        """
-        Verify JSON array is parsed correctly.
-        """
-        result = parse_cors_origins('["http://localhost:3000", "https://example.com"]')
-
-        assert result == ["http://localhost:3000", "https://example.com"]
-
-    def test_parses_comma_separated(self) -> None:
-        """
-        Verify comma-separated string is parsed correctly.
-        """
-        result = parse_cors_origins("http://localhost:3000,https://example.com")
-
-        assert result == ["http://localhost:3000", "https://example.com"]
-
-    def test_strips_whitespace_from_comma_separated(self) -> None:
-        """
-        Verify whitespace is stripped from comma-separated values.
-        """
-        result = parse_cors_origins("http://localhost:3000 , https://example.com , http://app.test")
+    Clears the same environment variables as clear_settings_env, which is
+    function-scoped and therefore not available to a module-scoped fixture.
+    """
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        for var in SETTINGS_ENV_VARS:
+            monkeypatch.delenv(var, raising=False)
+        return _create_settings()
 
-        assert result == ["http://localhost:3000", "https://example.com", "http://app.test"]
 
-    def test_returns_empty_list_for_empty_string(self) -> None:
-        """
-        Verify empty string returns empty list.
-        """
-        result = parse_cors_origins("")
-
-        assert result == []
+class TestParseCORSOrigins:
+    """
+    Tests for parse_cors_origins function.
+    """
 
-    def test_returns_empty_list_for_whitespace_only(self) -> None:
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            ('["http://localhost:3000", "https://example.com"]', ["http://localhost:3000", "https://example.com"]),
+            ("http://localhost:3000,https://example.com", ["http://localhost:3000", "https://example.com"]),
+            (
+                "http://localhost:3000 , https://example.com , http://app.test",
+                ["http://localhost:3000", "https://example.com", "http://app.test"],
+            ),
+            ("http://localhost:3000", ["http://localhost:3000"]),
+            ("http://localhost:3000,,https://example.com,", ["http://localhost:3000", "https://example.com"]),
+            ("", []),
+            ("   ", []),
+        ],
+        ids=[
+            "json_array",
+            "comma_separated",
+            "strips_whitespace",
+            "single_value",
+            "ignores_empty_entries",
+            "empty_string",
+            "whitespace_only",
+        ],
+    )
+    def test_parses_string(self, raw: str, expected: list[str]) -> None:
         """
-        Verify whitespace-only string returns empty list.
+        Verify JSON arrays and comma-separated strings parse to origin lists.
         """
-        result = parse_cors_origins("   ")
-
-        assert result == []
+        assert parse_cors_origins(raw) == expected
 
     def test_passes_through_list(self) -> None:
         """
@@ -113,22 +124,6 @@ class TestParseCORSOrigins:
         with pytest.raises(TypeError, match="string or array"):
             parse_cors_origins(42)
 
-    def test_single_value_without_comma(self) -> None:
-        """
-        Verify single value without comma is parsed correctly.
-        """
-        result = parse_cors_origins("http://localhost:3000")
-
-        assert result == ["http://localhost:3000"]
-
-    def test_ignores_empty_entries_in_comma_separated(self) -> None:
-        """
-        Verify empty entries are filtered out.
-        """
-        result = parse_cors_origins("http://localhost:3000,,https://example.com,")
-
-        assert result == ["http://localhost:3000", "https://example.com"]
-
     def test_invalid_json_is_rejected(self) -> None:
         """
         Verify invalid JSON starting with an array marker is rejected.
@@ -154,21 +149,24 @@ class TestSettings:
     Tests for Settings class.
     """
 
-    def test_default_environment(self) -> None:
-        """
-        Verify default environment is production.
+    @pytest.mark.parametrize(
+        ("field", "expected"),
+        [
+            ("environment", "production"),
+            ("log_level", "INFO"),
+            ("max_request_size_bytes", 1_000_000),
+            ("cors_origins", []),
+            ("google_application_credentials", None),
+            ("firestore_database", None),
+        ],
+    )
+    def test_default_value(self, default_settings: Settings, field: str, expected: object) -> None:
         """
-        settings = _create_settings()
+        Verify defaults are production-safe and optional Google Cloud fields stay unset.
 
-        assert settings.environment == "production"
-
-    def test_default_log_level(self) -> None:
-        """
-        Verify logging defaults to the production-safe INFO level.
+        A None Firestore database selects the project's default database.
         """
-        settings = _create_settings()
-
-        assert settings.log_level == "INFO"
+        assert getattr(default_settings, field) == expected
 
     @pytest.mark.parametrize(
         ("environment", "expected"),
@@ -189,127 +187,55 @@ class TestSettings:
         with pytest.raises(ValidationError):
             cast("Any", Settings)(_env_file=None)
 
-    def test_default_max_request_size(self) -> None:
-        """
-        Verify default max request size.
-        """
-        settings = _create_settings()
-
-        assert settings.max_request_size_bytes == 1_000_000
-
-    def test_default_cors_origins_empty(self) -> None:
-        """
-        Verify CORS origins defaults to empty list.
-        """
-        settings = _create_settings()
-
-        assert settings.cors_origins == []
-
 
 class TestSettingsFromEnv:
     """
     Tests for settings loaded from environment variables.
     """
 
-    def test_environment_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_fields_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """
-        Verify environment is loaded from env var.
-        """
-        monkeypatch.setenv("ENVIRONMENT", "development")
-
-        settings = _create_settings()
-
-        assert settings.environment == "development"
+        Verify each scalar field is loaded from its env var.
 
-    def test_log_level_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        """
-        Verify the application log level is loaded from the environment.
+        The variables are independent, so one Settings build covers all of them.
         """
+        monkeypatch.setenv("ENVIRONMENT", "development")
         monkeypatch.setenv("LOG_LEVEL", "DEBUG")
-
-        settings = _create_settings()
-
-        assert settings.log_level == "DEBUG"
-
-    def test_firebase_project_id_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        """
-        Verify Firebase project ID is loaded from env var.
-        """
         monkeypatch.setenv("FIREBASE_PROJECT_ID", "my-project")
-
-        settings = _create_settings()
-
-        assert settings.firebase_project_id == "my-project"
-
-    def test_max_request_size_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        """
-        Verify max request size is loaded from env var.
-        """
         monkeypatch.setenv("MAX_REQUEST_SIZE_BYTES", "2000000")
+        monkeypatch.setenv("GOOGLE_APPLICATION_CREDENTIALS", "/path/to/creds.json")
 
         settings = _create_settings()
 
+        assert settings.environment == "development"
+        assert settings.log_level == "DEBUG"
+        assert settings.firebase_project_id == "my-project"
         assert settings.max_request_size_bytes == 2_000_000
+        assert settings.google_application_credentials == "/path/to/creds.json"
 
-    def test_cors_origins_from_env_json_array(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        """
-        Verify CORS origins is loaded from JSON array env var.
-        """
-        monkeypatch.setenv("CORS_ORIGINS", '["http://localhost:3000", "https://example.com"]')
-
-        settings = _create_settings()
-
-        assert settings.cors_origins == ["http://localhost:3000", "https://example.com"]
-
-    def test_cors_origins_from_env_comma_separated(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        """
-        Verify CORS origins is loaded from comma-separated env var.
-        """
-        monkeypatch.setenv("CORS_ORIGINS", "http://localhost:3000,https://example.com")
-
-        settings = _create_settings()
-
-        assert settings.cors_origins == ["http://localhost:3000", "https://example.com"]
-
-    def test_cors_origins_comma_separated_with_spaces(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        """
-        Verify CORS origins handles comma-separated values with spaces.
-        """
-        monkeypatch.setenv("CORS_ORIGINS", "http://localhost:3000, https://example.com , http://app.test")
-
-        settings = _create_settings()
-
-        assert settings.cors_origins == ["http://localhost:3000", "https://example.com", "http://app.test"]
-
-    def test_cors_origins_single_value(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        """
-        Verify CORS origins handles single value without comma.
-        """
-        monkeypatch.setenv("CORS_ORIGINS", "http://localhost:3000")
-
-        settings = _create_settings()
-
-        assert settings.cors_origins == ["http://localhost:3000"]
-
-    def test_cors_origins_empty_string(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        """
-        Verify CORS origins handles empty string.
-        """
-        monkeypatch.setenv("CORS_ORIGINS", "")
-
-        settings = _create_settings()
-
-        assert settings.cors_origins == []
-
-    def test_google_credentials_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            ('["http://localhost:3000", "https://example.com"]', ["http://localhost:3000", "https://example.com"]),
+            ("http://localhost:3000,https://example.com", ["http://localhost:3000", "https://example.com"]),
+            (
+                "http://localhost:3000, https://example.com , http://app.test",
+                ["http://localhost:3000", "https://example.com", "http://app.test"],
+            ),
+            ("http://localhost:3000", ["http://localhost:3000"]),
+            ("", []),
+        ],
+        ids=["json_array", "comma_separated", "comma_separated_with_spaces", "single_value", "empty_string"],
+    )
+    def test_cors_origins_from_env(self, monkeypatch: pytest.MonkeyPatch, raw: str, expected: list[str]) -> None:
         """
-        Verify Google credentials path is loaded from env var.
+        Verify CORS origins env var formats reach the settings field.
         """
-        monkeypatch.setenv("GOOGLE_APPLICATION_CREDENTIALS", "/path/to/creds.json")
+        monkeypatch.setenv("CORS_ORIGINS", raw)
 
         settings = _create_settings()
 
-        assert settings.google_application_credentials == "/path/to/creds.json"
+        assert settings.cors_origins == expected
 
     def test_case_insensitive_env_vars(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """
@@ -346,17 +272,23 @@ class TestSettingsIgnoreExtra:
     Tests for extra fields handling.
     """
 
-    def test_ignores_unknown_env_vars(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_ignores_unknown_env_vars(self, tmp_path: Path) -> None:
         """
-        Verify unknown env vars are ignored.
+        Verify unknown .env entries are ignored.
+
+        The environment source only reads declared fields, so unrelated .env entries
+        are what the extra policy has to tolerate at startup.
         """
-        monkeypatch.setenv("UNKNOWN_SETTING", "value")
+        env_file = tmp_path / ".env"
+        env_file.write_text("FIREBASE_PROJECT_ID=test-project\nUNKNOWN_SETTING=value\n", encoding="utf-8")
 
-        settings = _create_settings()
+        settings = cast("Any", Settings)(_env_file=env_file)
 
+        assert settings.firebase_project_id == "test-project"
         assert not hasattr(settings, "unknown_setting")
 
 
+@pytest.mark.usefixtures("fresh_settings")
 class TestGetSettings:
     """
     Tests for get_settings function.
@@ -367,18 +299,17 @@ class TestGetSettings:
         Verify get_settings returns Settings instance.
         """
         monkeypatch.setenv("FIREBASE_PROJECT_ID", "cache-test-project")
-        get_settings.cache_clear()
 
         settings = get_settings()
 
         assert isinstance(settings, Settings)
+        assert settings.firebase_project_id == "cache-test-project"
 
     def test_returns_cached_instance(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """
         Verify get_settings returns the same cached instance.
         """
         monkeypatch.setenv("FIREBASE_PROJECT_ID", "cache-test-project")
-        get_settings.cache_clear()
 
         settings1 = get_settings()
         settings2 = get_settings()
@@ -390,32 +321,9 @@ class TestGetSettings:
         Verify cache_clear creates a new settings instance.
         """
         monkeypatch.setenv("FIREBASE_PROJECT_ID", "cache-test-project")
-        get_settings.cache_clear()
         settings1 = get_settings()
 
         get_settings.cache_clear()
         settings2 = get_settings()
 
         assert settings1 is not settings2
-
-
-class TestSettingsOptionalFields:
-    """
-    Tests for optional settings fields.
-    """
-
-    def test_google_credentials_default_none(self) -> None:
-        """
-        Verify Google credentials defaults to None.
-        """
-        settings = _create_settings()
-
-        assert settings.google_application_credentials is None
-
-    def test_firestore_database_default_none(self) -> None:
-        """
-        Verify Firestore database defaults to None (uses default database).
-        """
-        settings = _create_settings()
-
-        assert settings.firestore_database is None
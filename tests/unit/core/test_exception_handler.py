@@ -2,17 +2,36 @@
 Unit tests for exception handler hooks.
 """
 
-from unittest.mock import MagicMock
+from collections.abc import Callable
 
+import pytest
+from rfc9457 import Problem
+from starlette.requests import Request
 from starlette.responses import JSONResponse
 
-from app.core.cbor import CBORDecodeError
+from app.core.cbor import (
+    CBORDecodeError,
+    CBORDecodeHTTPException,
+    CBORDecodeProblem,
+    NotAcceptableHTTPException,
+    NotAcceptableProblem,
+    UnsupportedMediaTypeHTTPException,
+    UnsupportedMediaTypeProblem,
+)
 from app.core.constants import PROBLEM_SCHEMA_PATH, VALIDATION_PROBLEM_SCHEMA_PATH
 from app.core.exception_handler import (
     cbor_decode_error_handler,
+    cbor_decode_http_exception_handler,
+    exception_handler,
+    invalid_cursor_error_handler,
+    not_acceptable_handler,
     schema_link_post_hook,
     strip_about_blank_type_post_hook,
+    unsupported_media_type_handler,
 )
+from app.pagination import InvalidCursorError
+
+REQUEST = Request({"type": "http", "method": "GET", "path": "/test", "query_string": b"", "headers": []})
 
 
 class TestStripAboutBlankTypePostHook:
@@ -20,56 +39,89 @@ class TestStripAboutBlankTypePostHook:
 
     def test_strips_about_blank_type(self) -> None:
         """Verify type field is removed when value is about:blank."""
-        request = MagicMock()
         content = {"type": "about:blank", "title": "Error", "status": 400}
         response = JSONResponse(content=content)
 
-        result_content, _result_response = strip_about_blank_type_post_hook(content, request, response)
+        result_content, _result_response = strip_about_blank_type_post_hook(content, REQUEST, response)
 
         assert "type" not in result_content
         assert result_content == {"title": "Error", "status": 400}
 
     def test_preserves_non_about_blank_type(self) -> None:
         """Verify type field is preserved when not about:blank."""
-        request = MagicMock()
         content = {"type": "https://example.com/error", "title": "Error", "status": 400}
         response = JSONResponse(content=content)
 
-        result_content, _result_response = strip_about_blank_type_post_hook(content, request, response)
+        result_content, _result_response = strip_about_blank_type_post_hook(content, REQUEST, response)
 
         assert result_content["type"] == "https://example.com/error"
         assert result_content == {"type": "https://example.com/error", "title": "Error", "status": 400}
 
 
-class TestCBORDecodeErrorHandler:
-    """Tests for cbor_decode_error_handler."""
-
-    def test_returns_cbor_decode_problem(self) -> None:
-        """
-        Verify handler converts CBORDecodeError to CBORDecodeProblem.
-        """
-        exception_handler = MagicMock()
-        request = MagicMock()
-        exc = CBORDecodeError("Custom decode error")
-
-        from app.core.cbor import CBORDecodeProblem
-
-        result = cbor_decode_error_handler(exception_handler, request, exc)
-
-        assert isinstance(result, CBORDecodeProblem)
-        assert result.detail == "Custom decode error"
-
-    def test_uses_default_message(self) -> None:
+class TestProblemHandlers:
+    """Tests for exception-to-Problem handlers."""
+
+    @pytest.mark.parametrize(
+        ("handler", "exc", "problem_type", "status", "detail"),
+        [
+            (
+                cbor_decode_error_handler,
+                CBORDecodeError("Custom decode error"),
+                CBORDecodeProblem,
+                400,
+                "Custom decode error",
+            ),
+            (cbor_decode_error_handler, CBORDecodeError(), CBORDecodeProblem, 400, "Invalid CBOR data"),
+            (
+                cbor_decode_http_exception_handler,
+                CBORDecodeHTTPException("Malformed CBOR"),
+                CBORDecodeProblem,
+                400,
+                "Malformed CBOR",
+            ),
+            (
+                unsupported_media_type_handler,
+                UnsupportedMediaTypeHTTPException("Unsupported type"),
+                UnsupportedMediaTypeProblem,
+                415,
+                "Unsupported type",
+            ),
+            (
+                not_acceptable_handler,
+                NotAcceptableHTTPException(),
+                NotAcceptableProblem,
+                406,
+                "Supported response formats: application/json, application/cbor",
+            ),
+            (invalid_cursor_error_handler, InvalidCursorError("bad cursor"), Problem, 400, "bad cursor"),
+            (invalid_cursor_error_handler, InvalidCursorError(), Problem, 400, "invalid cursor format"),
+        ],
+        ids=[
+            "cbor_decode",
+            "cbor_decode_default",
+            "cbor_decode_http",
+            "unsupported_media_type",
+            "not_acceptable",
+            "invalid_cursor",
+            "invalid_cursor_default",
+        ],
+    )
+    def test_returns_problem(
+        self,
+        handler: Callable[..., Problem],
+        exc: Exception,
+        problem_type: type[Problem],
+        status: int,
+        detail: str,
+    ) -> None:
         """
-        Verify handler uses default detail when not specified.
+        Verify each handler maps its exception to the expected Problem.
         """
-        exception_handler = MagicMock()
-        request = MagicMock()
-        exc = CBORDecodeError()
-
-        result = cbor_decode_error_handler(exception_handler, request, exc)
+        result = handler(exception_handler, REQUEST, exc)
 
-        assert result.detail == "Invalid CBOR data"
+        assert isinstance(result, problem_type)
+        assert result.status == status
+        assert result.detail == detail
 
 
 class TestSchemaLinkPostHook:
@@ -77,22 +129,20 @@ class TestSchemaLinkPostHook:
 
     def test_preserves_problem_content(self) -> None:
         """Schema discovery does not mutate the Problem Details body."""
-        request = MagicMock()
         content = {"title": "Not Found", "status": 404, "detail": "Resource not found"}
         response = JSONResponse(content=content)
 
-        result_content, _result_response = schema_link_post_hook(content, request, response)
+        result_content, _result_response = schema_link_post_hook(content, REQUEST, response)
 
         assert result_content == content
         assert "$schema" not in result_content
 
     def test_adds_link_header_with_describedby(self) -> None:
         """Verify Link header with rel=describedBy is added."""
-        request = MagicMock()
         content = {"title": "Error", "status": 500}
         response = JSONResponse(content=content)
 
-        _result_content, result_response = schema_link_post_hook(content, request, response)
+        _result_content, result_response = schema_link_post_hook(content, REQUEST, response)
 
         assert "Link" in result_response.headers
         assert result_response.headers["Link"] == f'<{PROBLEM_SCHEMA_PATH}>; rel="describedBy"'
@@ -101,21 +151,19 @@ class TestSchemaLinkPostHook:
         """
         Verify structured validation errors use their specific schema.
         """
-        request = MagicMock()
         content = {"title": "Unprocessable Entity", "status": 422, "errors": []}
         response = JSONResponse(content=content)
 
-        _result_content, result_response = schema_link_post_hook(content, request, response)
+        _result_content, result_response = schema_link_post_hook(content, REQUEST, response)
 
         assert result_response.headers["Link"] == f'<{VALIDATION_PROBLEM_SCHEMA_PATH}>; rel="describedBy"'
 
     def test_does_not_change_content_length(self) -> None:
         """Adding a header does not rewrite the response body."""
-        request = MagicMock()
         content = {"title": "Error", "status": 400}
         response = JSONResponse(content=content)
         original_length = response.headers["content-length"]
 
-        _result_content, result_response = schema_link_post_hook(content, request, response)
+        _result_content, result_response = schema_link_post_hook(content, REQUEST, response)
 
         assert result_response.headers["content-length"] == original_length
@@ -3,6 +3,7 @@ Unit tests for Firebase initialization and configuration.
 """
 
 from collections.abc import Generator
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
@@ -67,11 +68,11 @@ class TestInitializeFirebase:
         """
         Verify the Firebase app project does not depend on the active gcloud default.
         """
-        app = MagicMock()
+        app = object()
         initialize_app = mocker.patch("app.core.firebase.firebase_admin.initialize_app", return_value=app)
         mocker.patch(
             "app.core.firebase.get_settings",
-            return_value=MagicMock(firebase_project_id="configured-project", google_application_credentials=None),
+            return_value=SimpleNamespace(firebase_project_id="configured-project", google_application_credentials=None),
         )
 
         initialize_firebase()
@@ -83,13 +84,13 @@ class TestInitializeFirebase:
         """
         Verify service-account initialization retains the configured project boundary.
         """
-        credential = MagicMock()
-        app = MagicMock()
+        credential = object()
+        app = object()
         certificate = mocker.patch("app.core.firebase.credentials.Certificate", return_value=credential)
         initialize_app = mocker.patch("app.core.firebase.firebase_admin.initialize_app", return_value=app)
         mocker.patch(
             "app.core.firebase.get_settings",
-            return_value=MagicMock(
+            return_value=SimpleNamespace(
                 firebase_project_id="configured-project",
                 google_application_credentials="/credentials/service-account.json",
             ),
@@ -118,7 +119,7 @@ class TestInitializeFirebase:
         """
         mocker.patch(
             "app.core.firebase.get_settings",
-            return_value=MagicMock(firebase_project_id="configured-project", google_application_credentials=None),
+            return_value=SimpleNamespace(firebase_project_id="configured-project", google_application_credentials=None),
         )
         mocker.patch("app.core.firebase.firebase_admin.initialize_app", side_effect=RuntimeError("ADC unavailable"))
 
@@ -135,14 +136,14 @@ class TestGetAsyncFirestoreClient:
         """
         Verify AsyncClient is created lazily on first call.
         """
-        mock_async_client = MagicMock()
+        mock_async_client = object()
         mock_async_client_cls = mocker.patch(
             "app.core.firebase.AsyncClient",
             return_value=mock_async_client,
         )
         mocker.patch(
             "app.core.firebase.get_settings",
-            return_value=MagicMock(firebase_project_id="test-project", firestore_database=None),
+            return_value=SimpleNamespace(firebase_project_id="test-project", firestore_database=None),
         )
 
         result = get_async_firestore_client()
@@ -154,14 +155,14 @@ class TestGetAsyncFirestoreClient:
         """
         Verify AsyncClient is created with custom database when configured.
         """
-        mock_async_client = MagicMock()
+        mock_async_client = object()
         mock_async_client_cls = mocker.patch(
             "app.core.firebase.AsyncClient",
             return_value=mock_async_client,
         )
         mocker.patch(
             "app.core.firebase.get_settings",
-            return_value=MagicMock(firebase_project_id="test-project", firestore_database="custom-db"),
+            return_value=SimpleNamespace(firebase_project_id="test-project", firestore_database="custom-db"),
         )
 
         result = get_async_firestore_client()
@@ -12,6 +12,8 @@ from pytest_mock import MockerFixture
 
 from app.core.logging import configure_logging
 
+INFO_SETTINGS = SimpleNamespace(log_level="INFO")
+
 
 @pytest.fixture(autouse=True)
 def restore_logging_state() -> Generator[None]:
@@ -47,7 +49,7 @@ def test_configures_gcp_json_formatter(mocker: MockerFixture) -> None:
     """
     Verify application logs use the package's GCP formatter.
     """
-    mocker.patch("app.core.logging.get_settings", return_value=SimpleNamespace(log_level="INFO"))
+    mocker.patch("app.core.logging.get_settings", return_value=INFO_SETTINGS)
 
     configure_logging()
 
@@ -76,7 +78,7 @@ def test_disables_uvicorn_access_logger(mocker: MockerFixture) -> None:
     """
     Verify Uvicorn does not duplicate package access records.
     """
-    mocker.patch("app.core.logging.get_settings", return_value=SimpleNamespace(log_level="INFO"))
+    mocker.patch("app.core.logging.get_settings", return_value=INFO_SETTINGS)
 
     configure_logging()
 
@@ -92,7 +94,7 @@ def test_configuration_is_idempotent(mocker: MockerFixture) -> None:
     """
     mock_get_settings = mocker.patch(
         "app.core.logging.get_settings",
-        return_value=SimpleNamespace(log_level="INFO"),
+        return_value=INFO_SETTINGS,
     )
 
     configure_logging()
@@ -2,69 +2,101 @@
 Unit tests for validation error handler.
 """
 
-from typing import Any
-from unittest.mock import MagicMock
-
 import pytest
 from fastapi.exceptions import RequestValidationError
 from rfc9457 import Problem
+from starlette.requests import Request
 
+from app.core.exception_handler import exception_handler
 from app.core.validation import (
     SENSITIVE_FIELD_NAMES,
+    _is_sensitive_segment,
     is_safe_validation_value,
     is_sensitive_field,
     loc_to_dot_notation,
     validation_error_handler,
 )
 
+REQUEST = Request({"type": "http", "method": "POST", "path": "/test", "query_string": b"", "headers": []})
+MULTIPLE_ERRORS_EXC = RequestValidationError(
+    errors=[
+        {
+            "type": "string_type",
+            "loc": ("body", "email"),
+            "msg": "value is not a valid email address",
+            "input": "invalid",
+        },
+        {
+            "type": "missing",
+            "loc": ("body", "name"),
+            "msg": "Field required",
+            "input": None,
+        },
+    ]
+)
+ARRAY_INDEX_EXC = RequestValidationError(
+    errors=[
+        {
+            "type": "string_type",
+            "loc": ("body", "items", 0, "name"),
+            "msg": "Field required",
+            "input": None,
+        }
+    ]
+)
 
-class TestLocToDotNotation:
-    """Tests for loc_to_dot_notation function."""
-
-    def test_simple_body_field(self) -> None:
-        """Simple body.field location."""
-        result = loc_to_dot_notation(("body", "email"))
-        assert result == "body.email"
-
-    def test_nested_field(self) -> None:
-        """Nested field location."""
-        result = loc_to_dot_notation(("body", "user", "name"))
-        assert result == "body.user.name"
-
-    def test_array_index(self) -> None:
-        """Array index in location."""
-        result = loc_to_dot_notation(("body", "items", 0, "name"))
-        assert result == "body.items[0].name"
-
-    def test_multiple_array_indices(self) -> None:
-        """Multiple array indices in location."""
-        result = loc_to_dot_notation(("body", "matrix", 0, 1))
-        assert result == "body.matrix[0][1]"
-
-    def test_query_param(self) -> None:
-        """Query parameter location."""
-        result = loc_to_dot_notation(("query", "page"))
-        assert result == "query.page"
 
-    def test_single_element(self) -> None:
-        """Single element location."""
-        result = loc_to_dot_notation(("body",))
-        assert result == "body"
+@pytest.fixture(scope="module")
+def single_error_problem() -> Problem:
+    """Problem for one email validation error, shared by tests that only read it."""
+    exc = RequestValidationError(
+        errors=[
+            {
+                "type": "string_type",
+                "loc": ("body", "email"),
+                "msg": "value is not a valid email address",
+                "input": "invalid",
+            }
+        ]
+    )
+    return validation_error_handler(exception_handler, REQUEST, exc)
 
-    def test_empty_location(self) -> None:
-        """Empty location returns empty string."""
-        result = loc_to_dot_notation(())
-        assert result == ""
 
-    def test_integer_first_element(self) -> None:
-        """Integer as first element (edge case)."""
-        result = loc_to_dot_notation((0, "name"))
-        assert result == "[0].name"
+class TestLocToDotNotation:
+    """Tests for loc_to_dot_notation function."""
 
-    def test_deep_nested_with_indices(self) -> None:
-        """Deep nesting with mixed types."""
-        result = loc_to_dot_notation(("body", "data", 0, "items", 1, "value"))
-        assert result == "body.data[0].items[1].value"
+    @pytest.mark.parametrize(
+        ("loc", "expected"),
+        [
+            (("body", "email"), "body.email"),
+            (("body", "user", "name"), "body.user.name"),
+            (("body", "items", 0, "name"), "body.items[0].name"),
+            (("body", "matrix", 0, 1), "body.matrix[0][1]"),
+            (("query", "page"), "query.page"),
+            (("body",), "body"),
+            ((0,), "[0]"),
+            (("body", 0), "body[0]"),
+            ((), ""),
+            ((0, "name"), "[0].name"),
+            (("body", "data", 0, "items", 1, "value"), "body.data[0].items[1].value"),
+        ],
+        ids=[
+            "simple_body_field",
+            "nested_field",
+            "array_index",
+            "multiple_array_indices",
+            "query_param",
+            "single_element",
+            "single_index",
+            "two_element_index",
+            "empty_location",
+            "integer_first_element",
+            "deep_nested_with_indices",
+        ],
+    )
+    def test_loc(self, loc: tuple[str | int, ...], expected: str) -> None:
+        """Location tuples render as dotted paths with bracketed indices."""
+        assert loc_to_dot_notation(loc) == expected
 
 
 class TestIsSensitiveField:
@@ -108,6 +140,10 @@ class TestIsSensitiveField:
         assert is_sensitive_field(("body", "items", 0, "password")) is True
         assert is_sensitive_field(("body", "items", 0, "email")) is False
 
+    def test_segment_cache_is_bounded(self) -> None:
+        """Client-supplied body keys cannot grow the segment cache without limit."""
+        assert _is_sensitive_segment.cache_parameters()["maxsize"] == 128
+
 
 class TestIsSafeValidationValue:
     """Tests for validation value disclosure policy."""
@@ -135,202 +171,88 @@ class TestIsSafeValidationValue:
 class TestValidationErrorHandler:
     """Tests for validation_error_handler function."""
 
-    @pytest.fixture
-    def mock_request(self) -> MagicMock:
-        """Create a mock request for validation error handling."""
-        mock = MagicMock()
-        mock.base_url = "http://testserver/"
-        return mock
-
-    @pytest.fixture
-    def mock_eh(self) -> MagicMock:
-        """Create mock exception handler."""
-        return MagicMock()
-
-    def _make_validation_error(
-        self,
-        errors: list[dict[str, Any]],
-    ) -> RequestValidationError:
-        """Create a RequestValidationError with given errors."""
-        return RequestValidationError(errors=errors)
-
-    def test_returns_problem_with_correct_fields(
-        self,
-        mock_eh: MagicMock,
-        mock_request: MagicMock,
-    ) -> None:
+    def test_returns_problem_with_correct_fields(self, single_error_problem: Problem) -> None:
         """Returns Problem with correct title, status, and detail per RFC 9457."""
-        errors = [
-            {
-                "type": "string_type",
-                "loc": ("body", "name"),
-                "msg": "Field required",
-                "input": None,
-            }
-        ]
-        exc = self._make_validation_error(errors)
-
-        result = validation_error_handler(mock_eh, mock_request, exc)
-
-        assert isinstance(result, Problem)
-        assert result.title == "Unprocessable Entity"
-        assert result.status == 422
-        assert result.detail == "validation failed"
-        assert "$schema" not in result.extras
-        assert len(result.extras["errors"]) == 1
-
-    def test_omits_complete_body_attached_to_missing_field(
-        self,
-        mock_eh: MagicMock,
-        mock_request: MagicMock,
-    ) -> None:
-        """Missing-field errors never echo a complete request body."""
-        exc = self._make_validation_error(
-            [
-                {
-                    "type": "missing",
-                    "loc": ("body", "first_name"),
-                    "msg": "Field required",
-                    "input": {"email": "private@example.com", "password": "do-not-echo"},
-                }
-            ]
-        )
-
-        result = validation_error_handler(mock_eh, mock_request, exc)
-
-        assert "value" not in result.extras["errors"][0]
-
-    def test_includes_error_location_and_message(
-        self,
-        mock_eh: MagicMock,
-        mock_request: MagicMock,
-    ) -> None:
+        assert isinstance(single_error_problem, Problem)
+        assert single_error_problem.title == "Unprocessable Entity"
+        assert single_error_problem.status == 422
+        assert single_error_problem.detail == "validation failed"
+        assert "$schema" not in single_error_problem.extras
+        assert len(single_error_problem.extras["errors"]) == 1
+
+    def test_includes_error_location_and_message(self, single_error_problem: Problem) -> None:
         """Error includes location and message."""
-        errors = [
-            {
-                "type": "string_type",
-                "loc": ("body", "email"),
-                "msg": "value is not a valid email address",
-                "input": "invalid",
-            }
-        ]
-        exc = self._make_validation_error(errors)
-
-        result = validation_error_handler(mock_eh, mock_request, exc)
-
-        result_errors = result.extras["errors"]
-        assert len(result_errors) == 1
-        error = result_errors[0]
-        assert error["location"] == "body.email"
-        assert error["message"] == "value is not a valid email address"
-        assert error["value"] == "invalid"
-
-    def test_redacts_sensitive_field_values(
-        self,
-        mock_eh: MagicMock,
-        mock_request: MagicMock,
-    ) -> None:
-        """Sensitive field values are not included in errors."""
-        errors = [
-            {
-                "type": "string_too_short",
-                "loc": ("body", "password"),
-                "msg": "String should have at least 8 characters",
-                "input": "secret123",
-            }
-        ]
-        exc = self._make_validation_error(errors)
-
-        result = validation_error_handler(mock_eh, mock_request, exc)
-
-        result_errors = result.extras["errors"]
-        assert len(result_errors) == 1
-        error = result_errors[0]
-        assert error["location"] == "body.password"
-        assert error["message"] == "String should have at least 8 characters"
-        assert "value" not in error
-
-    def test_redacts_nested_sensitive_fields(
-        self,
-        mock_eh: MagicMock,
-        mock_request: MagicMock,
-    ) -> None:
-        """Nested sensitive fields are redacted."""
-        errors = [
-            {
-                "type": "string_type",
-                "loc": ("body", "user", "api_key"),
-                "msg": "Field required",
-                "input": "my-secret-key",
-            }
+        assert single_error_problem.extras["errors"] == [
+            {"location": "body.email", "message": "value is not a valid email address", "value": "invalid"}
         ]
-        exc = self._make_validation_error(errors)
-
-        result = validation_error_handler(mock_eh, mock_request, exc)
 
-        assert "value" not in result.extras["errors"][0]
-
-    def test_multiple_errors(
-        self,
-        mock_eh: MagicMock,
-        mock_request: MagicMock,
-    ) -> None:
+    def test_multiple_errors(self) -> None:
         """Multiple validation errors are included."""
-        errors = [
-            {
-                "type": "string_type",
-                "loc": ("body", "email"),
-                "msg": "value is not a valid email address",
-                "input": "invalid",
-            },
-            {
-                "type": "missing",
-                "loc": ("body", "name"),
-                "msg": "Field required",
-                "input": None,
-            },
-        ]
-        exc = self._make_validation_error(errors)
-
-        result = validation_error_handler(mock_eh, mock_request, exc)
+        result = validation_error_handler(exception_handler, REQUEST, MULTIPLE_ERRORS_EXC)
 
         assert len(result.extras["errors"]) == 2
 
-    def test_array_index_in_location(
-        self,
-        mock_eh: MagicMock,
-        mock_request: MagicMock,
-    ) -> None:
+    def test_array_index_in_location(self) -> None:
         """Array indices in location are formatted correctly."""
-        errors = [
-            {
-                "type": "string_type",
-                "loc": ("body", "items", 0, "name"),
-                "msg": "Field required",
-                "input": None,
-            }
-        ]
-        exc = self._make_validation_error(errors)
-
-        result = validation_error_handler(mock_eh, mock_request, exc)
+        result = validation_error_handler(exception_handler, REQUEST, ARRAY_INDEX_EXC)
 
         assert result.extras["errors"][0]["location"] == "body.items[0].name"
 
-    def test_error_without_input(
+    @pytest.mark.parametrize(
+        ("exc", "expected_error"),
+        [
+            (
+                RequestValidationError(
+                    [
+                        {
+                            "type": "missing",
+                            "loc": ("body", "first_name"),
+                            "msg": "Field required",
+                            "input": {"email": "private@example.com", "password": "do-not-echo"},
+                        }
+                    ]
+                ),
+                {"location": "body.first_name", "message": "Field required"},
+            ),
+            (
+                RequestValidationError(
+                    [
+                        {
+                            "type": "string_too_short",
+                            "loc": ("body", "password"),
+                            "msg": "String should have at least 8 characters",
+                            "input": "secret123",
+                        }
+                    ]
+                ),
+                {"location": "body.password", "message": "String should have at least 8 characters"},
+            ),
+            (
+                RequestValidationError(
+                    [
+                        {
+                            "type": "string_type",
+                            "loc": ("body", "user", "api_key"),
+                            "msg": "Field required",
+                            "input": "my-secret-key",
+                        }
+                    ]
+                ),
+                {"location": "body.user.api_key", "message": "Field required"},
+            ),
+            (
+                RequestValidationError([{"type": "missing", "loc": ("body", "name"), "msg": "Field required"}]),
+                {"location": "body.name", "message": "Field required"},
+            ),
+        ],
+        ids=["complete_body", "sensitive_field", "nested_sensitive_field", "without_input"],
+    )
+    def test_omits_value(
         self,
-        mock_eh: MagicMock,
-        mock_request: MagicMock,
+        exc: RequestValidationError,
+        expected_error: dict[str, str],
     ) -> None:
-        """Error without 'input' key is handled."""
-        errors = [
-            {
-                "type": "missing",
-                "loc": ("body", "name"),
-                "msg": "Field required",
-            }
-        ]
-        exc = self._make_validation_error(errors)
-
-        result = validation_error_handler(mock_eh, mock_request, exc)
+        """Complete bodies, sensitive fields and missing inputs never produce a value."""
+        result = validation_error_handler(exception_handler, REQUEST, exc)
 
-        assert "value" not in result.extras["errors"][0]
+        assert result.extras["errors"] == [expected_error]
@@ -1,80 +1,41 @@
 """
 Unit tests for profile-related exceptions.
-
-Note: tests/unit/models/test_profile_model.py uses a different basename to avoid
-a pytest module naming conflict with this file. Pytest requires unique basenames.
 """
 
+import pytest
 from fastapi_problem.error import ConflictProblem, NotFoundProblem, Problem
 
 from app.exceptions.profile import ProfileAlreadyExistsError, ProfileNotFoundError
 
+type ProfileErrorClass = type[ProfileNotFoundError | ProfileAlreadyExistsError]
 
-class TestProfileNotFoundError:
-    """
-    Tests for ProfileNotFoundError.
-    """
-
-    def test_status_is_404(self) -> None:
-        """
-        Verify status is 404.
-        """
-        err = ProfileNotFoundError()
-        assert err.status == 404
-
-    def test_default_title(self) -> None:
-        """
-        Verify default title message.
-        """
-        err = ProfileNotFoundError()
-        assert err.title == "Profile not found"
-
-    def test_inherits_from_not_found_problem(self) -> None:
-        """
-        Verify inheritance chain.
-        """
-        err = ProfileNotFoundError()
-        assert isinstance(err, NotFoundProblem)
-        assert isinstance(err, Problem)
+PROFILE_ERROR_CASES = [
+    (ProfileNotFoundError, 404, "Profile not found", NotFoundProblem),
+    (ProfileAlreadyExistsError, 409, "Profile already exists", ConflictProblem),
+]
+PROFILE_ERROR_IDS = ["not_found", "already_exists"]
 
-    def test_custom_detail(self) -> None:
-        """
-        Verify custom detail can be set.
-        """
-        err = ProfileNotFoundError(detail="User profile not found")
-        assert err.detail == "User profile not found"
 
-
-class TestProfileAlreadyExistsError:
+@pytest.mark.parametrize(
+    ("error_cls", "status", "title", "base_cls"),
+    PROFILE_ERROR_CASES,
+    ids=PROFILE_ERROR_IDS,
+)
+def test_defaults(error_cls: ProfileErrorClass, status: int, title: str, base_cls: type[Problem]) -> None:
     """
-    Tests for ProfileAlreadyExistsError.
+    Verify default status, title and inheritance chain.
     """
+    err = error_cls()
+    assert err.status == status
+    assert err.title == title
+    assert isinstance(err, base_cls)
+    assert isinstance(err, Problem)
 
-    def test_status_is_409(self) -> None:
-        """
-        Verify status is 409.
-        """
-        err = ProfileAlreadyExistsError()
-        assert err.status == 409
-
-    def test_default_title(self) -> None:
-        """
-        Verify default title message.
-        """
-        err = ProfileAlreadyExistsError()
-        assert err.title == "Profile already exists"
-
-    def test_inherits_from_conflict_problem(self) -> None:
-        """
-        Verify inheritance chain.
-        """
-        err = ProfileAlreadyExistsError()
-        assert isinstance(err, ConflictProblem)
-        assert isinstance(err, Problem)
 
-    def test_custom_detail(self) -> None:
-        """
-        Verify custom detail can be set.
-        """
-        err = ProfileAlreadyExistsError(detail="Duplicate profile for user")
-        assert err.detail == "Duplicate profile for user"
+@pytest.mark.parametrize("error_cls", [case[0] for case in PROFILE_ERROR_CASES], ids=PROFILE_ERROR_IDS)
+def test_custom_detail(error_cls: ProfileErrorClass) -> None:
+    """
+    Verify custom detail can be set.
+    """
+    err = error_cls(detail="Custom profile detail")
+    assert err.detail == "Custom profile detail"
@@ -2,25 +2,30 @@
 Unit tests for body size limit middleware.
 """
 
+from functools import cache
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import cbor2
+import httpx2
 import pytest
 from fastapi_request_observability import RequestContextMiddleware
 from starlette.applications import Starlette
 from starlette.requests import Request
 from starlette.responses import JSONResponse, PlainTextResponse
-from starlette.testclient import TestClient
-from starlette.types import Receive, Scope, Send
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.middleware.body_limit import BodySizeLimitMiddleware
 from tests.helpers.starlette_utils import build_starlette_app
 
 
+@cache
 def _create_app(max_size: int = 1024) -> Starlette:
     """
     Create a minimal Starlette app with body limit middleware.
+
+    The middleware stack is built while settings are patched, so the limit is fixed
+    at construction and tests sharing a limit can share the cached app.
     """
 
     async def echo(request: Request) -> JSONResponse:
@@ -37,77 +42,83 @@ def _create_app(max_size: int = 1024) -> Starlette:
         ],
     )
 
-    # Patch settings before adding middleware
+    app.add_middleware(BodySizeLimitMiddleware)  # type: ignore[arg-type]
+    app.add_middleware(RequestContextMiddleware)
     with patch("app.middleware.body_limit.get_settings") as mock_settings:
         mock_settings.return_value.max_request_size_bytes = max_size
-        app.add_middleware(BodySizeLimitMiddleware)  # type: ignore[arg-type]
-        app.add_middleware(RequestContextMiddleware)
+        app.middleware_stack = app.build_middleware_stack()
 
     return app
 
 
+def _create_middleware(app: ASGIApp, max_size: int) -> BodySizeLimitMiddleware:
+    """
+    Create the middleware directly with a patched request size limit.
+    """
+    with patch("app.middleware.body_limit.get_settings") as mock_settings:
+        mock_settings.return_value.max_request_size_bytes = max_size
+        return BodySizeLimitMiddleware(app)
+
+
+def _client(app: Starlette) -> httpx2.AsyncClient:
+    """
+    Create an in-process async client that calls the ASGI app directly.
+    """
+    return httpx2.AsyncClient(transport=httpx2.ASGITransport(app=app), base_url="http://testserver")
+
+
 class TestBodySizeLimit:
     """
     Tests for BodySizeLimitMiddleware.
     """
 
-    def test_small_body_passes(self) -> None:
+    async def test_small_body_passes(self) -> None:
         """
         Verify small request body is allowed.
         """
-        with patch("app.middleware.body_limit.get_settings") as mock_settings:
-            mock_settings.return_value.max_request_size_bytes = 1024
-            app = _create_app(max_size=1024)
-            with TestClient(app) as client:
-                response = client.post("/echo", content=b"x" * 100)
-                assert response.status_code == 200
-                assert response.json()["size"] == 100
+        app = _create_app(max_size=1024)
+        async with _client(app) as client:
+            response = await client.post("/echo", content=b"x" * 100)
+            assert response.status_code == 200
+            assert response.json()["size"] == 100
 
-    def test_large_body_rejected_by_content_length(self) -> None:
+    async def test_large_body_rejected_by_content_length(self) -> None:
         """
         Verify request with Content-Length exceeding limit returns 413.
         """
-        with patch("app.middleware.body_limit.get_settings") as mock_settings:
-            mock_settings.return_value.max_request_size_bytes = 100
-            app = _create_app(max_size=100)
-            with TestClient(app) as client:
-                response = client.post("/echo", content=b"x" * 200)
-                assert response.status_code == 413
-                assert "too large" in response.json()["detail"].lower()
+        app = _create_app(max_size=100)
+        async with _client(app) as client:
+            response = await client.post("/echo", content=b"x" * 200)
+            assert response.status_code == 413
+            assert "too large" in response.json()["detail"].lower()
 
-    def test_get_request_passes(self) -> None:
+    async def test_get_request_passes(self) -> None:
         """
         Verify GET requests without body are not affected.
         """
-        with patch("app.middleware.body_limit.get_settings") as mock_settings:
-            mock_settings.return_value.max_request_size_bytes = 100
-            app = _create_app(max_size=100)
-            with TestClient(app) as client:
-                response = client.get("/ping")
-                assert response.status_code == 200
-                assert response.text == "pong"
+        app = _create_app(max_size=100)
+        async with _client(app) as client:
+            response = await client.get("/ping")
+            assert response.status_code == 200
+            assert response.text == "pong"
 
-    def test_exact_limit_passes(self) -> None:
+    async def test_exact_limit_passes(self) -> None:
         """
         Verify request body exactly at limit is allowed.
         """
-        with patch("app.middleware.body_limit.get_settings") as mock_settings:
-            mock_settings.return_value.max_request_size_bytes = 100
-            app = _create_app(max_size=100)
-            with TestClient(app) as client:
-                response = client.post("/echo", content=b"x" * 100)
-                assert response.status_code == 200
+        app = _create_app(max_size=100)
+        async with _client(app) as client:
+            response = await client.post("/echo", content=b"x" * 100)
+            assert response.status_code == 200
 
-    def test_one_over_limit_rejected(self) -> None:
+    async def test_one_over_limit_rejected(self) -> None:
         """
         Verify request body one byte over limit is rejected.
         """
-        with patch("app.middleware.body_limit.get_settings") as mock_settings:
-            mock_settings.return_value.max_request_size_bytes = 100
-            app = _create_app(max_size=100)
-            with TestClient(app) as client:
-                response = client.post("/echo", content=b"x" * 101)
-                assert response.status_code == 413
+        app = _create_app(max_size=100)
+        async with _client(app) as client:
+            response = await client.post("/echo", content=b"x" * 101)
+            assert response.status_code == 413
 
 
 class TestBodySizeLimitErrorResponse:
@@ -115,63 +126,46 @@ class TestBodySizeLimitErrorResponse:
     Tests for 413 error response RFC 9457 Problem Details format.
     """
 
-    def test_413_response_format(self) -> None:
+    async def test_413_response_format(self) -> None:
         """
         Verify 413 response has RFC 9457 Problem Details format.
         """
-        with patch("app.middleware.body_limit.get_settings") as mock_settings:
-            mock_settings.return_value.max_request_size_bytes = 10
-            app = _create_app(max_size=10)
-            with TestClient(app) as client:
-                response = client.post("/echo", content=b"x" * 100)
-                assert response.status_code == 413
-                assert response.headers.get("content-type") == "application/problem+json"
-                body = response.json()
-                assert body["title"] == "Payload Too Large"
-                assert body["status"] == 413
-                assert body["detail"] == "Request body too large"
-                assert "$schema" not in body
-                assert response.headers["Link"] == '</schemas/ProblemResponse.json>; rel="describedBy"'
-                assert response.headers["Vary"] == "Accept"
-
-    def test_413_response_detail_message(self) -> None:
-        """
-        Verify 413 response has meaningful detail message.
-        """
-        with patch("app.middleware.body_limit.get_settings") as mock_settings:
-            mock_settings.return_value.max_request_size_bytes = 10
-            app = _create_app(max_size=10)
-            with TestClient(app) as client:
-                response = client.post("/echo", content=b"x" * 100)
-                assert response.json()["detail"] == "Request body too large"
-
-    def test_413_response_includes_request_id(self) -> None:
+        app = _create_app(max_size=10)
+        async with _client(app) as client:
+            response = await client.post("/echo", content=b"x" * 100)
+            assert response.status_code == 413
+            assert response.headers.get("content-type") == "application/problem+json"
+            body = response.json()
+            assert body["title"] == "Payload Too Large"
+            assert body["status"] == 413
+            assert body["detail"] == "Request body too large"
+            assert "$schema" not in body
+            assert response.headers["Link"] == '</schemas/ProblemResponse.json>; rel="describedBy"'
+            assert response.headers["Vary"] == "Accept"
+
+    async def test_413_response_includes_request_id(self) -> None:
         """
         Verify 413 response includes X-Request-ID header.
         """
-        with patch("app.middleware.body_limit.get_settings") as mock_settings:
-            mock_settings.return_value.max_request_size_bytes = 10
-            app = _create_app(max_size=10)
-            with TestClient(app) as client:
-                response = client.post("/echo", content=b"x" * 100)
-                assert response.status_code == 413
-                assert "x-request-id" in response.headers
+        app = _create_app(max_size=10)
+        async with _client(app) as client:
+            response = await client.post("/echo", content=b"x" * 100)
+            assert response.status_code == 413
+            assert "x-request-id" in response.headers
 
-    def test_413_response_echoes_incoming_request_id(self) -> None:
+    async def test_413_response_echoes_incoming_request_id(self) -> None:
         """
         Verify 413 response echoes incoming X-Request-ID header.
         """
-        with patch("app.middleware.body_limit.get_settings") as mock_settings:
-            mock_settings.return_value.max_request_size_bytes = 10
-            app = _create_app(max_size=10)
-            with TestClient(app) as client:
-                response = client.post(
-                    "/echo",
-                    content=b"x" * 100,
-                    headers={"X-Request-ID": "test-request-id-123"},
-                )
-                assert response.status_code == 413
-                assert response.headers.get("x-request-id") == "test-request-id-123"
+        app = _create_app(max_size=10)
+        async with _client(app) as client:
+            response = await client.post(
+                "/echo",
+                content=b"x" * 100,
+                headers={"X-Request-ID": "test-request-id-123"},
+            )
+            assert response.status_code == 413
+            assert response.headers.get("x-request-id") == "test-request-id-123"
 
 
 class TestBodySizeLimitCBORNegotiation:
@@ -179,64 +173,58 @@ class TestBodySizeLimitCBORNegotiation:
     Tests for CBOR content negotiation in 413 responses.
     """
 
-    def test_413_returns_cbor_when_accept_cbor(self) -> None:
+    async def test_413_returns_cbor_when_accept_cbor(self) -> None:
         """
         Verify 413 response returns CBOR when Accept: application/cbor.
         """
-        with patch("app.middleware.body_limit.get_settings") as mock_settings:
-            mock_settings.return_value.max_request_size_bytes = 10
-            app = _create_app(max_size=10)
-            with TestClient(app) as client:
-                response = client.post(
-                    "/echo",
-                    content=b"x" * 100,
-                    headers={"Accept": "application/cbor"},
-                )
-                assert response.status_code == 413
-                assert response.headers.get("content-type") == "application/cbor"
-                body = cbor2.loads(response.content)
-                assert body["title"] == "Payload Too Large"
-                assert body["status"] == 413
-                assert body["detail"] == "Request body too large"
-
-    def test_413_returns_json_without_cbor_accept(self) -> None:
+        app = _create_app(max_size=10)
+        async with _client(app) as client:
+            response = await client.post(
+                "/echo",
+                content=b"x" * 100,
+                headers={"Accept": "application/cbor"},
+            )
+            assert response.status_code == 413
+            assert response.headers.get("content-type") == "application/cbor"
+            body = cbor2.loads(response.content)
+            assert body["title"] == "Payload Too Large"
+            assert body["status"] == 413
+            assert body["detail"] == "Request body too large"
+
+    async def test_413_returns_json_without_cbor_accept(self) -> None:
         """
         Verify 413 response returns JSON when Accept header does not include CBOR.
         """
-        with patch("app.middleware.body_limit.get_settings") as mock_settings:
-            mock_settings.return_value.max_request_size_bytes = 10
-            app = _create_app(max_size=10)
-            with TestClient(app) as client:
-                response = client.post(
-                    "/echo",
-                    content=b"x" * 100,
-                    headers={"Accept": "application/json"},
-                )
-                assert response.status_code == 413
-                assert response.headers.get("content-type") == "application/problem+json"
-                body = response.json()
-                assert body["title"] == "Payload Too Large"
-
-    def test_413_combines_repeated_accept_fields(self) -> None:
+        app = _create_app(max_size=10)
+        async with _client(app) as client:
+            response = await client.post(
+                "/echo",
+                content=b"x" * 100,
+                headers={"Accept": "application/json"},
+            )
+            assert response.status_code == 413
+            assert response.headers.get("content-type") == "application/problem+json"
+            body = response.json()
+            assert body["title"] == "Payload Too Large"
+
+    async def test_413_combines_repeated_accept_fields(self) -> None:
         """
         Verify all lines of the list-based Accept field are negotiated.
         """
-        with patch("app.middleware.body_limit.get_settings") as mock_settings:
-            mock_settings.return_value.max_request_size_bytes = 10
-            app = _create_app(max_size=10)
-            with TestClient(app) as client:
-                response = client.post(
-                    "/echo",
-                    content=b"x" * 100,
-                    headers=[
-                        ("Accept", "application/problem+json;q=0.1"),
-                        ("Accept", "application/cbor;q=1"),
-                    ],
-                )
-
-                assert response.status_code == 413
-                assert response.headers["content-type"] == "application/cbor"
-                assert cbor2.loads(response.content)["status"] == 413
+        app = _create_app(max_size=10)
+        async with _client(app) as client:
+            response = await client.post(
+                "/echo",
+                content=b"x" * 100,
+                headers=[
+                    ("Accept", "application/problem+json;q=0.1"),
+                    ("Accept", "application/cbor;q=1"),
+                ],
+            )
+
+            assert response.status_code == 413
+            assert response.headers["content-type"] == "application/cbor"
+            assert cbor2.loads(response.content)["status"] == 413
 
     @pytest.mark.parametrize(
         "accept",
@@ -245,29 +233,27 @@ class TestBodySizeLimitCBORNegotiation:
             "application/problem+json;q=0, application/cbor;q=0",
         ],
     )
-    def test_oversized_request_preserves_413_when_accept_is_unsupported(self, accept: str) -> None:
+    async def test_oversized_request_preserves_413_when_accept_is_unsupported(self, accept: str) -> None:
         """
         Verify representation negotiation never masks request-size rejection.
         """
-        with patch("app.middleware.body_limit.get_settings") as mock_settings:
-            mock_settings.return_value.max_request_size_bytes = 10
-            app = _create_app(max_size=10)
-            with TestClient(app) as client:
-                response = client.post(
-                    "/echo",
-                    content=b"x" * 100,
-                    headers={"Accept": accept},
-                )
-
-                assert response.status_code == 413
-                assert response.headers["content-type"] == "application/problem+json"
-                assert response.headers["Vary"] == "Accept"
-                assert response.headers["Link"] == '</schemas/ProblemResponse.json>; rel="describedBy"'
-                assert response.json() == {
-                    "title": "Payload Too Large",
-                    "status": 413,
-                    "detail": "Request body too large",
-                }
+        app = _create_app(max_size=10)
+        async with _client(app) as client:
+            response = await client.post(
+                "/echo",
+                content=b"x" * 100,
+                headers={"Accept": accept},
+            )
+
+            assert response.status_code == 413
+            assert response.headers["content-type"] == "application/problem+json"
+            assert response.headers["Vary"] == "Accept"
+            assert response.headers["Link"] == '</schemas/ProblemResponse.json>; rel="describedBy"'
+            assert response.json() == {
+                "title": "Payload Too Large",
+                "status": 413,
+                "detail": "Request body too large",
+            }
 
 
 class TestBodySizeLimitEdgeCases:
@@ -279,160 +265,162 @@ class TestBodySizeLimitEdgeCases:
         """
         Verify non-HTTP scopes (websocket, lifespan) pass through unchanged.
         """
-        with patch("app.middleware.body_limit.get_settings") as mock_settings:
-            mock_settings.return_value.max_request_size_bytes = 100
-
-            downstream_called = False
+        downstream_called = False
 
-            async def mock_app(scope: Scope, receive: Receive, send: Send) -> None:
-                nonlocal downstream_called
-                downstream_called = True
+        async def mock_app(scope: Scope, receive: Receive, send: Send) -> None:
+            nonlocal downstream_called
+            downstream_called = True
 
-            middleware = BodySizeLimitMiddleware(mock_app)
-            scope: dict[str, Any] = {"type": "websocket"}
-            receive = AsyncMock()
-            send = AsyncMock()
+        middleware = _create_middleware(mock_app, max_size=100)
+        scope: dict[str, Any] = {"type": "websocket"}
+        receive = AsyncMock()
+        send = AsyncMock()
 
-            await middleware(scope, receive, send)
+        await middleware(scope, receive, send)
 
-            assert downstream_called
+        assert downstream_called
 
     async def test_malformed_content_length_handled_gracefully(self) -> None:
         """
         Verify malformed Content-Length header doesn't crash middleware.
         """
-        with patch("app.middleware.body_limit.get_settings") as mock_settings:
-            mock_settings.return_value.max_request_size_bytes = 100
+        response_started = False
 
-            response_started = False
+        async def mock_app(scope: Scope, receive: Receive, send: Send) -> None:
+            nonlocal response_started
+            await receive()
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"ok"})
+            response_started = True
 
-            async def mock_app(scope: Scope, receive: Receive, send: Send) -> None:
-                nonlocal response_started
-                await receive()
-                await send({"type": "http.response.start", "status": 200, "headers": []})
-                await send({"type": "http.response.body", "body": b"ok"})
-                response_started = True
+        middleware = _create_middleware(mock_app, max_size=100)
+        scope: dict[str, Any] = {
+            "type": "http",
+            "headers": [(b"content-length", b"not-a-number")],
+        }
 
-            middleware = BodySizeLimitMiddleware(mock_app)
-            scope: dict[str, Any] = {
-                "type": "http",
-                "headers": [(b"content-length", b"not-a-number")],
-            }
+        receive_messages = [
+            {"type": "http.request", "body": b"small", "more_body": False},
+        ]
+        receive = AsyncMock(side_effect=receive_messages)
+        send = AsyncMock()
 
-            receive_messages = [
-                {"type": "http.request", "body": b"small", "more_body": False},
-            ]
-            receive = AsyncMock(side_effect=receive_messages)
-            send = AsyncMock()
+        await middleware(scope, receive, send)
+        assert response_started
 
-            await middleware(scope, receive, send)
-            assert response_started
+    async def test_last_repeated_content_length_wins(self) -> None:
+        """
+        Verify the last of repeated Content-Length fields decides early rejection.
+        """
+        downstream = AsyncMock()
+        middleware = _create_middleware(downstream, max_size=100)
+        scope: dict[str, Any] = {
+            "type": "http",
+            "headers": [(b"content-length", b"10"), (b"content-length", b"101")],
+        }
+        receive = AsyncMock()
+        send = AsyncMock()
+
+        await middleware(scope, receive, send)
+
+        assert send.await_args_list[0].args[0]["status"] == 413
+        downstream.assert_not_awaited()
+        receive.assert_not_awaited()
 
     async def test_413_send_failure_does_not_reach_downstream(self) -> None:
         """
         Verify a transport failure while rejecting a request fails closed.
         """
-        with patch("app.middleware.body_limit.get_settings") as mock_settings:
-            mock_settings.return_value.max_request_size_bytes = 100
-            downstream = AsyncMock()
-            middleware = BodySizeLimitMiddleware(downstream)
-            scope: dict[str, Any] = {
-                "type": "http",
-                "headers": [(b"content-length", b"101")],
-            }
-            receive = AsyncMock()
-            send = AsyncMock(side_effect=RuntimeError("transport closed"))
+        downstream = AsyncMock()
+        middleware = _create_middleware(downstream, max_size=100)
+        scope: dict[str, Any] = {
+            "type": "http",
+            "headers": [(b"content-length", b"101")],
+        }
+        receive = AsyncMock()
+        send = AsyncMock(side_effect=RuntimeError("transport closed"))
 
-            with pytest.raises(RuntimeError, match="transport closed"):
-                await middleware(scope, receive, send)
+        with pytest.raises(RuntimeError, match="transport closed"):
+            await middleware(scope, receive, send)
 
-            downstream.assert_not_awaited()
-            receive.assert_not_awaited()
+        downstream.assert_not_awaited()
+        receive.assert_not_awaited()
 
     async def test_request_without_content_length_uses_streaming(self) -> None:
         """
         Verify request without Content-Length is handled via streaming check.
         """
-        with patch("app.middleware.body_limit.get_settings") as mock_settings:
-            mock_settings.return_value.max_request_size_bytes = 100
-
-            received_body = b""
+        received_body = b""
 
-            async def mock_app(scope: Scope, receive: Receive, send: Send) -> None:
-                nonlocal received_body
-                msg = await receive()
-                received_body = msg.get("body", b"")
-                await send({"type": "http.response.start", "status": 200, "headers": []})
-                await send({"type": "http.response.body", "body": b"ok"})
+        async def mock_app(scope: Scope, receive: Receive, send: Send) -> None:
+            nonlocal received_body
+            msg = await receive()
+            received_body = msg.get("body", b"")
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"ok"})
 
-            middleware = BodySizeLimitMiddleware(mock_app)
-            scope: dict[str, Any] = {"type": "http", "headers": []}
+        middleware = _create_middleware(mock_app, max_size=100)
+        scope: dict[str, Any] = {"type": "http", "headers": []}
 
-            receive_messages = [
-                {"type": "http.request", "body": b"x" * 50, "more_body": False},
-            ]
-            receive = AsyncMock(side_effect=receive_messages)
-            send = AsyncMock()
+        receive_messages = [
+            {"type": "http.request", "body": b"x" * 50, "more_body": False},
+        ]
+        receive = AsyncMock(side_effect=receive_messages)
+        send = AsyncMock()
 
-            await middleware(scope, receive, send)
-            assert received_body == b"x" * 50
+        await middleware(scope, receive, send)
+        assert received_body == b"x" * 50
 
     async def test_streaming_body_exceeds_limit_returns_413(self) -> None:
         """
         Verify streaming body that exceeds limit during transfer returns 413.
         """
-        with patch("app.middleware.body_limit.get_settings") as mock_settings:
-            mock_settings.return_value.max_request_size_bytes = 100
+        middleware = _create_middleware(MagicMock(), max_size=100)
+        scope = {"type": "http", "headers": []}
 
-            middleware = BodySizeLimitMiddleware(MagicMock())
-            scope = {"type": "http", "headers": []}
+        receive_messages = [
+            {"type": "http.request", "body": b"x" * 60, "more_body": True},
+            {"type": "http.request", "body": b"x" * 60, "more_body": False},
+        ]
+        receive = AsyncMock(side_effect=receive_messages)
+        send = AsyncMock()
 
-            receive_messages = [
-                {"type": "http.request", "body": b"x" * 60, "more_body": True},
-                {"type": "http.request", "body": b"x" * 60, "more_body": False},
-            ]
-            receive = AsyncMock(side_effect=receive_messages)
-            send = AsyncMock()
+        await middleware(scope, receive, send)
 
-            await middleware(scope, receive, send)
-
-            calls = [call[0][0] for call in send.call_args_list]
-            response_start = next(c for c in calls if c.get("type") == "http.response.start")
-            assert response_start["status"] == 413
+        calls = [call[0][0] for call in send.call_args_list]
+        response_start = next(c for c in calls if c.get("type") == "http.response.start")
+        assert response_start["status"] == 413
 
     async def test_replay_receive_multiple_calls(self) -> None:
         """
         Verify replay_receive returns body on first call, empty on subsequent.
         """
-        with patch("app.middleware.body_limit.get_settings") as mock_settings:
-            mock_settings.return_value.max_request_size_bytes = 100
-
-            receive_calls: list[Any] = []
+        receive_calls: list[Any] = []
 
-            async def mock_app(scope: Scope, receive: Receive, send: Send) -> None:
-                msg1 = await receive()
-                receive_calls.append(msg1)
-                msg2 = await receive()
-                receive_calls.append(msg2)
-                await send({"type": "http.response.start", "status": 200, "headers": []})
-                await send({"type": "http.response.body", "body": b"ok"})
+        async def mock_app(scope: Scope, receive: Receive, send: Send) -> None:
+            msg1 = await receive()
+            receive_calls.append(msg1)
+            msg2 = await receive()
+            receive_calls.append(msg2)
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"ok"})
 
-            middleware = BodySizeLimitMiddleware(mock_app)
-            scope: dict[str, Any] = {"type": "http", "headers": []}
+        middleware = _create_middleware(mock_app, max_size=100)
+        scope: dict[str, Any] = {"type": "http", "headers": []}
 
-            receive_messages = [
-                {"type": "http.request", "body": b"test", "more_body": False},
-            ]
-            receive = AsyncMock(side_effect=receive_messages)
-            send = AsyncMock()
+        receive_messages = [
+            {"type": "http.request", "body": b"test", "more_body": False},
+        ]
+        receive = AsyncMock(side_effect=receive_messages)
+        send = AsyncMock()
 
-            await middleware(scope, receive, send)
+        await middleware(scope, receive, send)
 
-            assert len(receive_calls) == 2
-            assert receive_calls[0]["body"] == b"test"
-            assert receive_calls[0]["more_body"] is False
-            assert receive_calls[1]["body"] == b""
-            assert receive_calls[1]["more_body"] is False
+        assert len(receive_calls) == 2
+        assert receive_calls[0]["body"] == b"test"
+        assert receive_calls[0]["more_body"] is False
+        assert receive_calls[1]["body"] == b""
+        assert receive_calls[1]["more_body"] is False
 
 
 class TestBodySizeLimitWithChunkedTransfer:
@@ -444,80 +432,72 @@ class TestBodySizeLimitWithChunkedTransfer:
         """
         Verify multiple chunks that sum within limit are accepted.
         """
-        with patch("app.middleware.body_limit.get_settings") as mock_settings:
-            mock_settings.return_value.max_request_size_bytes = 100
+        received_body = b""
 
-            received_body = b""
+        async def mock_app(scope: Scope, receive: Receive, send: Send) -> None:
+            nonlocal received_body
+            msg = await receive()
+            received_body = msg.get("body", b"")
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"ok"})
 
-            async def mock_app(scope: Scope, receive: Receive, send: Send) -> None:
-                nonlocal received_body
-                msg = await receive()
-                received_body = msg.get("body", b"")
-                await send({"type": "http.response.start", "status": 200, "headers": []})
-                await send({"type": "http.response.body", "body": b"ok"})
+        middleware = _create_middleware(mock_app, max_size=100)
+        scope: dict[str, Any] = {"type": "http", "headers": []}
 
-            middleware = BodySizeLimitMiddleware(mock_app)
-            scope: dict[str, Any] = {"type": "http", "headers": []}
+        receive_messages = [
+            {"type": "http.request", "body": b"a" * 30, "more_body": True},
+            {"type": "http.request", "body": b"b" * 30, "more_body": True},
+            {"type": "http.request", "body": b"c" * 30, "more_body": False},
+        ]
+        receive = AsyncMock(side_effect=receive_messages)
+        send = AsyncMock()
 
-            receive_messages = [
-                {"type": "http.request", "body": b"a" * 30, "more_body": True},
-                {"type": "http.request", "body": b"b" * 30, "more_body": True},
-                {"type": "http.request", "body": b"c" * 30, "more_body": False},
-            ]
-            receive = AsyncMock(side_effect=receive_messages)
-            send = AsyncMock()
-
-            await middleware(scope, receive, send)
-            assert received_body == b"a" * 30 + b"b" * 30 + b"c" * 30
+        await middleware(scope, receive, send)
+        assert received_body == b"a" * 30 + b"b" * 30 + b"c" * 30
 
     async def test_stops_reading_body_after_413(self) -> None:
         """
         Verify an oversized stream cannot retain the request by sending more data slowly.
         """
-        with patch("app.middleware.body_limit.get_settings") as mock_settings:
-            mock_settings.return_value.max_request_size_bytes = 50
+        middleware = _create_middleware(MagicMock(), max_size=50)
+        scope = {"type": "http", "headers": []}
 
-            middleware = BodySizeLimitMiddleware(MagicMock())
-            scope = {"type": "http", "headers": []}
+        receive_messages = [
+            {"type": "http.request", "body": b"x" * 30, "more_body": True},
+            {"type": "http.request", "body": b"x" * 30, "more_body": True},
+            {"type": "http.request", "body": b"x" * 10, "more_body": False},
+        ]
+        receive = AsyncMock(side_effect=receive_messages)
+        send = AsyncMock()
 
-            receive_messages = [
-                {"type": "http.request", "body": b"x" * 30, "more_body": True},
-                {"type": "http.request", "body": b"x" * 30, "more_body": True},
-                {"type": "http.request", "body": b"x" * 10, "more_body": False},
-            ]
-            receive = AsyncMock(side_effect=receive_messages)
-            send = AsyncMock()
+        await middleware(scope, receive, send)
 
-            await middleware(scope, receive, send)
-
-            assert receive.call_count == 2
+        assert receive.call_count == 2
 
     async def test_unsupported_accept_still_stops_oversized_stream(self) -> None:
         """
         Verify 413 fallback does not read more body data or invoke the app.
         """
-        with patch("app.middleware.body_limit.get_settings") as mock_settings:
-            mock_settings.return_value.max_request_size_bytes = 50
-            downstream = AsyncMock()
-            middleware = BodySizeLimitMiddleware(downstream)
-            scope = {
-                "type": "http",
-                "headers": [(b"accept", b"application/xml")],
-            }
-            receive = AsyncMock(
-                side_effect=[
-                    {"type": "http.request", "body": b"x" * 30, "more_body": True},
-                    {"type": "http.request", "body": b"x" * 30, "more_body": True},
-                    {"type": "http.request", "body": b"x" * 10, "more_body": False},
-                ]
-            )
-            send = AsyncMock()
+        downstream = AsyncMock()
+        middleware = _create_middleware(downstream, max_size=50)
+        scope = {
+            "type": "http",
+            "headers": [(b"accept", b"application/xml")],
+        }
+        receive = AsyncMock(
+            side_effect=[
+                {"type": "http.request", "body": b"x" * 30, "more_body": True},
+                {"type": "http.request", "body": b"x" * 30, "more_body": True},
+                {"type": "http.request", "body": b"x" * 10, "more_body": False},
+            ]
+        )
+        send = AsyncMock()
 
-            await middleware(scope, receive, send)
+        await middleware(scope, receive, send)
 
-            response_start = next(
-                call.args[0] for call in send.call_args_list if call.args[0]["type"] == "http.response.start"
-            )
-            assert response_start["status"] == 413
-            assert receive.call_count == 2
-            downstream.assert_not_awaited()
+        response_start = next(
+            call.args[0] for call in send.call_args_list if call.args[0]["type"] == "http.response.start"
+        )
+        assert response_start["status"] == 413
+        assert receive.call_count == 2
+        downstream.assert_not_awaited()
@@ -1,15 +1,24 @@
 """
 Unit tests for security headers middleware.
+
+The test apps register no startup or shutdown handlers and the assertions only
+inspect status and headers, so requests are sent straight to the ASGI app.
 """
 
 import pytest
 from starlette.applications import Starlette
 from starlette.requests import Request
 from starlette.responses import PlainTextResponse
-from starlette.testclient import TestClient
 
 from app.middleware.security import SecurityHeadersMiddleware
-from tests.helpers.starlette_utils import build_starlette_app
+from tests.helpers.starlette_utils import build_starlette_app, call_asgi
+
+
+async def _ping(request: Request) -> PlainTextResponse:
+    return PlainTextResponse("pong")
+
+
+PING_ROUTES = (("/ping", _ping, ("GET",)),)
 
 
 def _create_app(
@@ -20,12 +29,8 @@ def _create_app(
     """
     Create a minimal Starlette app with security middleware.
     """
-
-    async def ping(request: Request) -> PlainTextResponse:
-        return PlainTextResponse("pong")
-
     return build_starlette_app(
-        routes=[("/ping", ping, ["GET"])],
+        routes=PING_ROUTES,
         middleware=[
             (
                 SecurityHeadersMiddleware,
@@ -39,37 +44,42 @@ def _create_app(
     )
 
 
+@pytest.fixture(scope="module")
+def default_app() -> Starlette:
+    """
+    Share one app for the default middleware configuration across the module.
+    """
+    return _create_app()
+
+
 class TestSecurityHeaders:
     """
     Tests for SecurityHeadersMiddleware.
     """
 
-    def test_x_frame_options_deny(self) -> None:
+    async def test_x_frame_options_deny(self, default_app: Starlette) -> None:
         """
         Verify X-Frame-Options header is set to DENY.
         """
-        with TestClient(_create_app()) as client:
-            response = client.get("/ping")
-            assert response.status_code == 200
-            assert response.headers.get("x-frame-options") == "DENY"
+        response = await call_asgi(default_app, "/ping")
+        assert response.status_code == 200
+        assert response.headers.get("x-frame-options") == "DENY"
 
-    def test_x_content_type_options_nosniff(self) -> None:
+    async def test_x_content_type_options_nosniff(self, default_app: Starlette) -> None:
         """
         Verify X-Content-Type-Options header is set to nosniff.
         """
-        with TestClient(_create_app()) as client:
-            response = client.get("/ping")
-            assert response.headers.get("x-content-type-options") == "nosniff"
+        response = await call_asgi(default_app, "/ping")
+        assert response.headers.get("x-content-type-options") == "nosniff"
 
-    def test_referrer_policy_strict_origin_when_cross_origin(self) -> None:
+    async def test_referrer_policy_strict_origin_when_cross_origin(self, default_app: Starlette) -> None:
         """
         Verify Referrer-Policy header is set to strict-origin-when-cross-origin.
         """
-        with TestClient(_create_app()) as client:
-            response = client.get("/ping")
-            assert response.headers.get("referrer-policy") == "strict-origin-when-cross-origin"
+        response = await call_asgi(default_app, "/ping")
+        assert response.headers.get("referrer-policy") == "strict-origin-when-cross-origin"
 
-    def test_preserves_existing_vary_and_adds_accept(self) -> None:
+    async def test_preserves_existing_vary_and_adds_accept(self) -> None:
         """
         Verify content negotiation augments an existing Vary header.
         """
@@ -82,34 +92,30 @@ class TestSecurityHeaders:
             middleware=[(SecurityHeadersMiddleware, {})],
         )
 
-        with TestClient(app) as client:
-            response = client.get("/ping")
+        response = await call_asgi(app, "/ping")
 
         assert response.headers["Vary"] == "Origin, Accept"
 
-    def test_custom_x_frame_options(self) -> None:
+    async def test_custom_x_frame_options(self) -> None:
         """
         Verify custom X-Frame-Options value is applied.
         """
-        with TestClient(_create_app(x_frame_options="SAMEORIGIN")) as client:
-            response = client.get("/ping")
-            assert response.headers.get("x-frame-options") == "SAMEORIGIN"
+        response = await call_asgi(_create_app(x_frame_options="SAMEORIGIN"), "/ping")
+        assert response.headers.get("x-frame-options") == "SAMEORIGIN"
 
-    def test_custom_referrer_policy(self) -> None:
+    async def test_custom_referrer_policy(self) -> None:
         """
         Verify custom Referrer-Policy value is applied.
         """
-        with TestClient(_create_app(referrer_policy="strict-origin")) as client:
-            response = client.get("/ping")
-            assert response.headers.get("referrer-policy") == "strict-origin"
+        response = await call_asgi(_create_app(referrer_policy="strict-origin"), "/ping")
+        assert response.headers.get("referrer-policy") == "strict-origin"
 
-    def test_no_hsts_on_http(self) -> None:
+    async def test_no_hsts_on_http(self, default_app: Starlette) -> None:
         """
         Verify HSTS header is not set for HTTP requests.
         """
-        with TestClient(_create_app()) as client:
-            response = client.get("/ping")
-            assert "strict-transport-security" not in response.headers
+        response = await call_asgi(default_app, "/ping")
+        assert "strict-transport-security" not in response.headers
 
 
 class TestHSTSHeader:
@@ -117,16 +123,13 @@ class TestHSTSHeader:
     Tests for HSTS header behavior.
     """
 
-    def test_hsts_on_https_when_enabled(self) -> None:
+    async def test_hsts_on_https_when_enabled(self) -> None:
         """
         Verify HSTS header is set for HTTPS when enabled.
         """
 
-        async def ping(request: Request) -> PlainTextResponse:
-            return PlainTextResponse("pong")
-
         app = build_starlette_app(
-            routes=[("/ping", ping, ["GET"])],
+            routes=PING_ROUTES,
             middleware=[
                 (
                     SecurityHeadersMiddleware,
@@ -135,40 +138,32 @@ class TestHSTSHeader:
             ],
         )
 
-        with TestClient(app, base_url="https://testserver") as client:
-            response = client.get("/ping")
-            hsts = response.headers.get("strict-transport-security")
-            assert hsts is not None
-            assert "max-age=31536000" in hsts
-            assert "includeSubDomains" in hsts
+        response = await call_asgi(app, "/ping", scheme="https")
+        hsts = response.headers.get("strict-transport-security")
+        assert hsts is not None
+        assert "max-age=31536000" in hsts
+        assert "includeSubDomains" in hsts
 
-    def test_no_hsts_when_disabled(self) -> None:
+    async def test_no_hsts_when_disabled(self) -> None:
         """
         Verify HSTS header is not set when disabled.
         """
 
-        async def ping(request: Request) -> PlainTextResponse:
-            return PlainTextResponse("pong")
-
         app = build_starlette_app(
-            routes=[("/ping", ping, ["GET"])],
+            routes=PING_ROUTES,
             middleware=[(SecurityHeadersMiddleware, {"hsts": False})],
         )
 
-        with TestClient(app, base_url="https://testserver") as client:
-            response = client.get("/ping")
-            assert "strict-transport-security" not in response.headers
+        response = await call_asgi(app, "/ping", scheme="https")
+        assert "strict-transport-security" not in response.headers
 
-    def test_hsts_without_include_subdomains(self) -> None:
+    async def test_hsts_without_include_subdomains(self) -> None:
         """
         Verify HSTS header omits includeSubDomains when disabled.
         """
 
-        async def ping(request: Request) -> PlainTextResponse:
-            return PlainTextResponse("pong")
-
         app = build_starlette_app(
-            routes=[("/ping", ping, ["GET"])],
+            routes=PING_ROUTES,
             middleware=[
                 (
                     SecurityHeadersMiddleware,
@@ -177,23 +172,19 @@ class TestHSTSHeader:
             ],
         )
 
-        with TestClient(app, base_url="https://testserver") as client:
-            response = client.get("/ping")
-            hsts = response.headers.get("strict-transport-security")
-            assert hsts is not None
-            assert hsts == "max-age=31536000"
-            assert "includeSubDomains" not in hsts
+        response = await call_asgi(app, "/ping", scheme="https")
+        hsts = response.headers.get("strict-transport-security")
+        assert hsts is not None
+        assert hsts == "max-age=31536000"
+        assert "includeSubDomains" not in hsts
 
-    def test_hsts_with_preload(self) -> None:
+    async def test_hsts_with_preload(self) -> None:
         """
         Verify HSTS header includes preload directive when enabled.
         """
 
-        async def ping(request: Request) -> PlainTextResponse:
-            return PlainTextResponse("pong")
-
         app = build_starlette_app(
-            routes=[("/ping", ping, ["GET"])],
+            routes=PING_ROUTES,
             middleware=[
                 (
                     SecurityHeadersMiddleware,
@@ -202,13 +193,12 @@ class TestHSTSHeader:
             ],
         )
 
-        with TestClient(app, base_url="https://testserver") as client:
-            response = client.get("/ping")
-            hsts = response.headers.get("strict-transport-security")
-            assert hsts is not None
-            assert "max-age=31536000" in hsts
-            assert "includeSubDomains" in hsts
-            assert "preload" in hsts
+        response = await call_asgi(app, "/ping", scheme="https")
+        hsts = response.headers.get("strict-transport-security")
+        assert hsts is not None
+        assert "max-age=31536000" in hsts
+        assert "includeSubDomains" in hsts
+        assert "preload" in hsts
 
 
 class TestCrossOriginOpenerPolicyHeader:
@@ -219,47 +209,38 @@ class TestCrossOriginOpenerPolicyHeader:
     protecting against Spectre-style side-channel attacks.
     """
 
-    def test_coop_same_origin_by_default(self) -> None:
+    async def test_coop_same_origin_by_default(self, default_app: Starlette) -> None:
         """
         Verify Cross-Origin-Opener-Policy header is set to same-origin by default.
         """
-        with TestClient(_create_app()) as client:
-            response = client.get("/ping")
-            assert response.headers.get("cross-origin-opener-policy") == "same-origin"
+        response = await call_asgi(default_app, "/ping")
+        assert response.headers.get("cross-origin-opener-policy") == "same-origin"
 
-    def test_custom_coop(self) -> None:
+    async def test_custom_coop(self) -> None:
         """
         Verify custom Cross-Origin-Opener-Policy value can be configured.
         """
 
-        async def ping(request: Request) -> PlainTextResponse:
-            return PlainTextResponse("pong")
-
         app = build_starlette_app(
-            routes=[("/ping", ping, ["GET"])],
+            routes=PING_ROUTES,
             middleware=[(SecurityHeadersMiddleware, {"cross_origin_opener_policy": "same-origin-allow-popups"})],
         )
 
-        with TestClient(app) as client:
-            response = client.get("/ping")
-            assert response.headers.get("cross-origin-opener-policy") == "same-origin-allow-popups"
+        response = await call_asgi(app, "/ping")
+        assert response.headers.get("cross-origin-opener-policy") == "same-origin-allow-popups"
 
-    def test_empty_coop_not_set(self) -> None:
+    async def test_empty_coop_not_set(self) -> None:
         """
         Verify empty Cross-Origin-Opener-Policy config omits the header.
         """
 
-        async def ping(request: Request) -> PlainTextResponse:
-            return PlainTextResponse("pong")
-
         app = build_starlette_app(
-            routes=[("/ping", ping, ["GET"])],
+            routes=PING_ROUTES,
             middleware=[(SecurityHeadersMiddleware, {"cross_origin_opener_policy": ""})],
         )
 
-        with TestClient(app) as client:
-            response = client.get("/ping")
-            assert "cross-origin-opener-policy" not in response.headers
+        response = await call_asgi(app, "/ping")
+        assert "cross-origin-opener-policy" not in response.headers
 
 
 class TestCrossOriginResourcePolicyHeader:
@@ -270,47 +251,38 @@ class TestCrossOriginResourcePolicyHeader:
     against Spectre-style side-channel attacks.
     """
 
-    def test_corp_same_origin_by_default(self) -> None:
+    async def test_corp_same_origin_by_default(self, default_app: Starlette) -> None:
         """
         Verify Cross-Origin-Resource-Policy header is set to same-origin by default.
         """
-        with TestClient(_create_app()) as client:
-            response = client.get("/ping")
-            assert response.headers.get("cross-origin-resource-policy") == "same-origin"
+        response = await call_asgi(default_app, "/ping")
+        assert response.headers.get("cross-origin-resource-policy") == "same-origin"
 
-    def test_custom_corp(self) -> None:
+    async def test_custom_corp(self) -> None:
         """
         Verify custom Cross-Origin-Resource-Policy value can be configured.
         """
 
-        async def ping(request: Request) -> PlainTextResponse:
-            return PlainTextResponse("pong")
-
         app = build_starlette_app(
-            routes=[("/ping", ping, ["GET"])],
+            routes=PING_ROUTES,
             middleware=[(SecurityHeadersMiddleware, {"cross_origin_resource_policy": "same-site"})],
         )
 
-        with TestClient(app) as client:
-            response = client.get("/ping")
-            assert response.headers.get("cross-origin-resource-policy") == "same-site"
+        response = await call_asgi(app, "/ping")
+        assert response.headers.get("cross-origin-resource-policy") == "same-site"
 
-    def test_empty_corp_not_set(self) -> None:
+    async def test_empty_corp_not_set(self) -> None:
         """
         Verify empty Cross-Origin-Resource-Policy config omits the header.
         """
 
-        async def ping(request: Request) -> PlainTextResponse:
-            return PlainTextResponse("pong")
-
         app = build_starlette_app(
-            routes=[("/ping", ping, ["GET"])],
+            routes=PING_ROUTES,
             middleware=[(SecurityHeadersMiddleware, {"cross_origin_resource_policy": ""})],
         )
 
-        with TestClient(app) as client:
-            response = client.get("/ping")
-            assert "cross-origin-resource-policy" not in response.headers
+        response = await call_asgi(app, "/ping")
+        assert "cross-origin-resource-policy" not in response.headers
 
 
 class TestPermissionsPolicyHeader:
@@ -321,53 +293,44 @@ class TestPermissionsPolicyHeader:
     not needed by REST APIs, reducing the attack surface.
     """
 
-    def test_permissions_policy_set_by_default(self) -> None:
+    async def test_permissions_policy_set_by_default(self, default_app: Starlette) -> None:
         """
         Verify Permissions-Policy header is set with disabled features by default.
         """
-        with TestClient(_create_app()) as client:
-            response = client.get("/ping")
-            policy = response.headers.get("permissions-policy")
-            assert policy is not None
-            assert "accelerometer=()" in policy
-            assert "camera=()" in policy
-            assert "geolocation=()" in policy
-            assert "microphone=()" in policy
-            assert "payment=()" in policy
+        response = await call_asgi(default_app, "/ping")
+        policy = response.headers.get("permissions-policy")
+        assert policy is not None
+        assert "accelerometer=()" in policy
+        assert "camera=()" in policy
+        assert "geolocation=()" in policy
+        assert "microphone=()" in policy
+        assert "payment=()" in policy
 
-    def test_custom_permissions_policy(self) -> None:
+    async def test_custom_permissions_policy(self) -> None:
         """
         Verify custom Permissions-Policy value can be configured.
         """
 
-        async def ping(request: Request) -> PlainTextResponse:
-            return PlainTextResponse("pong")
-
         app = build_starlette_app(
-            routes=[("/ping", ping, ["GET"])],
+            routes=PING_ROUTES,
             middleware=[(SecurityHeadersMiddleware, {"permissions_policy": "geolocation=(), camera=()"})],
         )
 
-        with TestClient(app) as client:
-            response = client.get("/ping")
-            assert response.headers.get("permissions-policy") == "geolocation=(), camera=()"
+        response = await call_asgi(app, "/ping")
+        assert response.headers.get("permissions-policy") == "geolocation=(), camera=()"
 
-    def test_empty_permissions_policy_not_set(self) -> None:
+    async def test_empty_permissions_policy_not_set(self) -> None:
         """
         Verify empty Permissions-Policy config omits the header.
         """
 
-        async def ping(request: Request) -> PlainTextResponse:
-            return PlainTextResponse("pong")
-
         app = build_starlette_app(
-            routes=[("/ping", ping, ["GET"])],
+            routes=PING_ROUTES,
             middleware=[(SecurityHeadersMiddleware, {"permissions_policy": ""})],
         )
 
-        with TestClient(app) as client:
-            response = client.get("/ping")
-            assert "permissions-policy" not in response.headers
+        response = await call_asgi(app, "/ping")
+        assert "permissions-policy" not in response.headers
 
 
 class TestSecurityHeadersDisabled:
@@ -375,21 +338,19 @@ class TestSecurityHeadersDisabled:
     Tests for disabled security headers.
     """
 
-    def test_empty_x_frame_options_not_set(self) -> None:
+    async def test_empty_x_frame_options_not_set(self) -> None:
         """
         Verify empty X-Frame-Options config omits the header.
         """
-        with TestClient(_create_app(x_frame_options="")) as client:
-            response = client.get("/ping")
-            assert "x-frame-options" not in response.headers
+        response = await call_asgi(_create_app(x_frame_options=""), "/ping")
+        assert "x-frame-options" not in response.headers
 
-    def test_empty_referrer_policy_not_set(self) -> None:
+    async def test_empty_referrer_policy_not_set(self) -> None:
         """
         Verify empty Referrer-Policy config omits the header.
         """
-        with TestClient(_create_app(referrer_policy="")) as client:
-            response = client.get("/ping")
-            assert "referrer-policy" not in response.headers
+        response = await call_asgi(_create_app(referrer_policy=""), "/ping")
+        assert "referrer-policy" not in response.headers
 
 
 class TestCacheControlHeader:
@@ -400,47 +361,38 @@ class TestCacheControlHeader:
     to prevent caching of sensitive data by proxies or browsers.
     """
 
-    def test_cache_control_no_store_by_default(self) -> None:
+    async def test_cache_control_no_store_by_default(self, default_app: Starlette) -> None:
         """
         Verify Cache-Control header is set to no-store by default.
         """
-        with TestClient(_create_app()) as client:
-            response = client.get("/ping")
-            assert response.headers.get("cache-control") == "no-store"
+        response = await call_asgi(default_app, "/ping")
+        assert response.headers.get("cache-control") == "no-store"
 
-    def test_custom_cache_control(self) -> None:
+    async def test_custom_cache_control(self) -> None:
         """
         Verify custom Cache-Control value can be configured.
         """
 
-        async def ping(request: Request) -> PlainTextResponse:
-            return PlainTextResponse("pong")
-
         app = build_starlette_app(
-            routes=[("/ping", ping, ["GET"])],
+            routes=PING_ROUTES,
             middleware=[(SecurityHeadersMiddleware, {"cache_control": "no-cache, no-store, must-revalidate"})],
         )
 
-        with TestClient(app) as client:
-            response = client.get("/ping")
-            assert response.headers.get("cache-control") == "no-cache, no-store, must-revalidate"
+        response = await call_asgi(app, "/ping")
+        assert response.headers.get("cache-control") == "no-cache, no-store, must-revalidate"
 
-    def test_empty_cache_control_not_set(self) -> None:
+    async def test_empty_cache_control_not_set(self) -> None:
         """
         Verify empty Cache-Control config omits the header.
         """
 
-        async def ping(request: Request) -> PlainTextResponse:
-            return PlainTextResponse("pong")
-
         app = build_starlette_app(
-            routes=[("/ping", ping, ["GET"])],
+            routes=PING_ROUTES,
             middleware=[(SecurityHeadersMiddleware, {"cache_control": ""})],
         )
 
-        with TestClient(app) as client:
-            response = client.get("/ping")
-            assert "cache-control" not in response.headers
+        response = await call_asgi(app, "/ping")
+        assert "cache-control" not in response.headers
 
 
 class TestContentSecurityPolicyHeader:
@@ -452,50 +404,41 @@ class TestContentSecurityPolicyHeader:
     are accidentally rendered as HTML.
     """
 
-    def test_csp_frame_ancestors_none_by_default(self) -> None:
+    async def test_csp_frame_ancestors_none_by_default(self, default_app: Starlette) -> None:
         """
         Verify Content-Security-Policy header is set to frame-ancestors 'none' by default.
 
         Per OWASP REST API Security Cheat Sheet, frame-ancestors 'none' is recommended
         for REST APIs to prevent clickjacking without being overly restrictive.
         """
-        with TestClient(_create_app()) as client:
-            response = client.get("/ping")
-            assert response.headers.get("content-security-policy") == "frame-ancestors 'none'"
+        response = await call_asgi(default_app, "/ping")
+        assert response.headers.get("content-security-policy") == "frame-ancestors 'none'"
 
-    def test_custom_csp(self) -> None:
+    async def test_custom_csp(self) -> None:
         """
         Verify custom Content-Security-Policy value can be configured.
         """
 
-        async def ping(request: Request) -> PlainTextResponse:
-            return PlainTextResponse("pong")
-
         app = build_starlette_app(
-            routes=[("/ping", ping, ["GET"])],
+            routes=PING_ROUTES,
             middleware=[(SecurityHeadersMiddleware, {"content_security_policy": "default-src 'self'"})],
         )
 
-        with TestClient(app) as client:
-            response = client.get("/ping")
-            assert response.headers.get("content-security-policy") == "default-src 'self'"
+        response = await call_asgi(app, "/ping")
+        assert response.headers.get("content-security-policy") == "default-src 'self'"
 
-    def test_empty_csp_not_set(self) -> None:
+    async def test_empty_csp_not_set(self) -> None:
         """
         Verify empty Content-Security-Policy config omits the header.
         """
 
-        async def ping(request: Request) -> PlainTextResponse:
-            return PlainTextResponse("pong")
-
         app = build_starlette_app(
-            routes=[("/ping", ping, ["GET"])],
+            routes=PING_ROUTES,
             middleware=[(SecurityHeadersMiddleware, {"content_security_policy": ""})],
         )
 
-        with TestClient(app) as client:
-            response = client.get("/ping")
-            assert "content-security-policy" not in response.headers
+        response = await call_asgi(app, "/ping")
+        assert "content-security-policy" not in response.headers
 
 
 class TestCSPDocumentationExemption:
@@ -512,7 +455,7 @@ class TestCSPDocumentationExemption:
         ["/api-docs", "/api-redoc", "/openapi.json"],
         ids=["swagger-ui", "redoc", "openapi-json"],
     )
-    def test_csp_skipped_for_documentation_paths(self, path: str) -> None:
+    async def test_csp_skipped_for_documentation_paths(self, path: str) -> None:
         """
         Verify Content-Security-Policy header is not set for documentation paths.
         """
@@ -525,12 +468,11 @@ class TestCSPDocumentationExemption:
             middleware=[(SecurityHeadersMiddleware, {})],
         )
 
-        with TestClient(app) as client:
-            response = client.get(path)
-            assert response.status_code == 200
-            assert "content-security-policy" not in response.headers
+        response = await call_asgi(app, path)
+        assert response.status_code == 200
+        assert "content-security-policy" not in response.headers
 
-    def test_csp_applied_for_non_documentation_paths(self) -> None:
+    async def test_csp_applied_for_non_documentation_paths(self) -> None:
         """
         Verify Content-Security-Policy header is still set for regular API paths.
         """
@@ -543,12 +485,11 @@ class TestCSPDocumentationExemption:
             middleware=[(SecurityHeadersMiddleware, {})],
         )
 
-        with TestClient(app) as client:
-            response = client.get("/api/users")
-            assert response.status_code == 200
-            assert response.headers.get("content-security-policy") == "frame-ancestors 'none'"
+        response = await call_asgi(app, "/api/users")
+        assert response.status_code == 200
+        assert response.headers.get("content-security-policy") == "frame-ancestors 'none'"
 
-    def test_other_security_headers_still_applied_for_documentation_paths(self) -> None:
+    async def test_other_security_headers_still_applied_for_documentation_paths(self) -> None:
         """
         Verify other security headers are still applied even when CSP is skipped.
 
@@ -563,13 +504,12 @@ class TestCSPDocumentationExemption:
             middleware=[(SecurityHeadersMiddleware, {})],
         )
 
-        with TestClient(app) as client:
-            response = client.get("/api-docs")
-            assert response.status_code == 200
-            # CSP should be skipped
-            assert "content-security-policy" not in response.headers
-            # But other security headers should still be present
-            assert response.headers.get("x-content-type-options") == "nosniff"
-            assert response.headers.get("x-frame-options") == "DENY"
-            assert response.headers.get("referrer-policy") == "strict-origin-when-cross-origin"
-            assert response.headers.get("cache-control") == "no-store"
+        response = await call_asgi(app, "/api-docs")
+        assert response.status_code == 200
+        # CSP should be skipped
+        assert "content-security-policy" not in response.headers
+        # But other security headers should still be present
+        assert response.headers.get("x-content-type-options") == "nosniff"
+        assert response.headers.get("x-frame-options") == "DENY"
+        assert response.headers.get("referrer-policy") == "strict-origin-when-cross-origin"
+        assert response.headers.get("cache-control") == "no-store"
@@ -1,9 +1,5 @@
 """
 Unit tests for profile models.
-
-Note: This file is named test_profile_model.py (not test_profile.py) to avoid
-a pytest module naming conflict with tests/unit/exceptions/test_profile.py.
-Pytest requires unique basenames across the test tree.
 """
 
 from datetime import UTC, datetime
@@ -20,23 +16,45 @@ from app.models.profile import (
 )
 
 
+@pytest.fixture(scope="module")
+def profile_create_data() -> dict[str, Any]:
+    """
+    Valid ProfileCreate input shared by tests that override or drop one field.
+    """
+    return {
+        "first_name": "John",
+        "last_name": "Doe",
+        "email": "john@example.com",
+        "phone_number": "+358401234567",
+        "terms": True,
+    }
+
+
+@pytest.fixture(scope="module")
+def profile_data(profile_create_data: dict[str, Any]) -> dict[str, Any]:
+    """
+    Valid Profile input shared by tests that override or drop one field.
+    """
+    now = datetime.now(UTC)
+    return {
+        **profile_create_data,
+        "id": "user-123",
+        "marketing": True,
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
 class TestProfileCreate:
     """
     Tests for ProfileCreate model.
     """
 
-    def test_valid_profile_create(self) -> None:
+    def test_valid_profile_create(self, profile_create_data: dict[str, Any]) -> None:
         """
         Verify valid data creates a ProfileCreate instance.
         """
-        profile = ProfileCreate(
-            first_name="John",
-            last_name="Doe",
-            email="john@example.com",
-            phone_number="+358401234567",
-            marketing=True,
-            terms=True,
-        )
+        profile = ProfileCreate.model_validate({**profile_create_data, "marketing": True})
         assert profile.first_name == "John"
         assert profile.last_name == "Doe"
         assert profile.email == "john@example.com"
@@ -44,162 +62,79 @@ class TestProfileCreate:
         assert profile.marketing is True
         assert profile.terms is True
 
-    def test_email_is_normalized(self) -> None:
+    def test_email_is_normalized(self, profile_create_data: dict[str, Any]) -> None:
         """
         Verify email is lowercased.
         """
-        profile = ProfileCreate(
-            first_name="John",
-            last_name="Doe",
-            email="JOHN@EXAMPLE.COM",
-            phone_number="+358401234567",
-            terms=True,
-        )
+        profile = ProfileCreate.model_validate({**profile_create_data, "email": "JOHN@EXAMPLE.COM"})
         assert profile.email == "john@example.com"
 
-    def test_marketing_defaults_to_false(self) -> None:
+    def test_marketing_defaults_to_false(self, profile_create_data: dict[str, Any]) -> None:
         """
         Verify marketing field defaults to False.
         """
-        profile = ProfileCreate(
-            first_name="John",
-            last_name="Doe",
-            email="john@example.com",
-            phone_number="+358401234567",
-            terms=True,
-        )
+        profile = ProfileCreate.model_validate(profile_create_data)
         assert profile.marketing is False
 
     @pytest.mark.parametrize(
         "missing_field",
         ["first_name", "last_name", "email", "phone_number", "terms"],
     )
-    def test_missing_required_field_raises(self, missing_field: str) -> None:
+    def test_missing_required_field_raises(self, profile_create_data: dict[str, Any], missing_field: str) -> None:
         """
         Verify missing required fields raise ValidationError.
         """
-        data = {
-            "first_name": "John",
-            "last_name": "Doe",
-            "email": "john@example.com",
-            "phone_number": "+358401234567",
-            "terms": True,
-        }
-        del data[missing_field]
+        data = {key: value for key, value in profile_create_data.items() if key != missing_field}
 
         with pytest.raises(ValidationError) as exc_info:
-            ProfileCreate(**cast("Any", data))
+            ProfileCreate.model_validate(data)
 
-        errors = exc_info.value.errors()
-        assert any(missing_field in str(err["loc"]) for err in errors)
+        assert (missing_field,) in {err["loc"] for err in exc_info.value.errors()}
 
-    def test_extra_fields_forbidden(self) -> None:
+    def test_extra_fields_forbidden(self, profile_create_data: dict[str, Any]) -> None:
         """
         Verify extra fields are rejected.
         """
         with pytest.raises(ValidationError) as exc_info:
-            cast("Any", ProfileCreate)(
-                first_name="John",
-                last_name="Doe",
-                email="john@example.com",
-                phone_number="+358401234567",
-                terms=True,
-                extra_field="not allowed",
-            )
+            ProfileCreate.model_validate({**profile_create_data, "extra_field": "not allowed"})
 
         errors = exc_info.value.errors()
         assert any("extra" in str(err["type"]) for err in errors)
 
-    def test_invalid_email_raises(self) -> None:
-        """
-        Verify invalid email format raises ValidationError.
-        """
-        with pytest.raises(ValidationError):
-            ProfileCreate(
-                first_name="John",
-                last_name="Doe",
-                email="not-an-email",
-                phone_number="+358401234567",
-                terms=True,
-            )
-
-    def test_invalid_phone_raises(self) -> None:
-        """
-        Verify invalid phone format raises ValidationError.
-        """
-        with pytest.raises(ValidationError):
-            ProfileCreate(
-                first_name="John",
-                last_name="Doe",
-                email="john@example.com",
-                phone_number="invalid-phone",
-                terms=True,
-            )
-
-    def test_empty_first_name_raises(self) -> None:
-        """
-        Verify empty first_name raises ValidationError.
-        """
-        with pytest.raises(ValidationError):
-            ProfileCreate(
-                first_name="",
-                last_name="Doe",
-                email="john@example.com",
-                phone_number="+358401234567",
-                terms=True,
-            )
-
-    def test_empty_last_name_raises(self) -> None:
-        """
-        Verify empty last_name raises ValidationError.
-        """
-        with pytest.raises(ValidationError):
-            ProfileCreate(
-                first_name="John",
-                last_name="",
-                email="john@example.com",
-                phone_number="+358401234567",
-                terms=True,
-            )
-
-    def test_first_name_max_length_raises(self) -> None:
+    @pytest.mark.parametrize(
+        ("field", "value"),
+        [
+            ("email", "not-an-email"),
+            ("phone_number", "invalid-phone"),
+            ("first_name", ""),
+            ("last_name", ""),
+            ("first_name", "J" * 101),
+            ("last_name", "D" * 101),
+        ],
+        ids=[
+            "invalid_email",
+            "invalid_phone",
+            "empty_first_name",
+            "empty_last_name",
+            "first_name_max_length",
+            "last_name_max_length",
+        ],
+    )
+    def test_invalid_field_raises(self, profile_create_data: dict[str, Any], field: str, value: str) -> None:
         """
-        Verify first_name exceeding max length raises ValidationError.
+        Verify invalid field values raise ValidationError.
         """
-        with pytest.raises(ValidationError):
-            ProfileCreate(
-                first_name="J" * 101,
-                last_name="Doe",
-                email="john@example.com",
-                phone_number="+358401234567",
-                terms=True,
-            )
+        with pytest.raises(ValidationError) as exc_info:
+            ProfileCreate.model_validate({**profile_create_data, field: value})
 
-    def test_last_name_max_length_raises(self) -> None:
-        """
-        Verify last_name exceeding max length raises ValidationError.
-        """
-        with pytest.raises(ValidationError):
-            ProfileCreate(
-                first_name="John",
-                last_name="D" * 101,
-                email="john@example.com",
-                phone_number="+358401234567",
-                terms=True,
-            )
+        assert [err["loc"] for err in exc_info.value.errors()] == [(field,)]
 
-    def test_terms_false_raises_validation_error(self) -> None:
+    def test_terms_false_raises_validation_error(self, profile_create_data: dict[str, Any]) -> None:
         """
         Verify terms=False raises ValidationError on profile creation.
         """
         with pytest.raises(ValidationError) as exc_info:
-            ProfileCreate(
-                first_name="John",
-                last_name="Doe",
-                email="john@example.com",
-                phone_number="+358401234567",
-                terms=False,
-            )
+            ProfileCreate.model_validate({**profile_create_data, "terms": False})
 
         errors = exc_info.value.errors()
         assert len(errors) == 1
@@ -207,17 +142,11 @@ class TestProfileCreate:
         assert "terms must be accepted" in errors[0]["msg"]
         assert errors[0]["type"] == "value_error"
 
-    def test_terms_true_accepted(self) -> None:
+    def test_terms_true_accepted(self, profile_create_data: dict[str, Any]) -> None:
         """
         Verify terms=True is accepted on profile creation.
         """
-        profile = ProfileCreate(
-            first_name="John",
-            last_name="Doe",
-            email="john@example.com",
-            phone_number="+358401234567",
-            terms=True,
-        )
+        profile = ProfileCreate.model_validate(profile_create_data)
         assert profile.terms is True
 
 
@@ -305,79 +234,37 @@ class TestProfile:
     Tests for complete Profile model with metadata.
     """
 
-    def test_valid_profile(self) -> None:
+    def test_valid_profile(self, profile_data: dict[str, Any]) -> None:
         """
         Verify valid data creates a Profile instance.
         """
-        now = datetime.now(UTC)
-        profile = Profile(
-            id="user-123",
-            first_name="John",
-            last_name="Doe",
-            email="john@example.com",
-            phone_number="+358401234567",
-            marketing=True,
-            terms=True,
-            created_at=now,
-            updated_at=now,
-        )
+        profile = Profile.model_validate(profile_data)
         assert profile.id == "user-123"
-        assert profile.created_at == now
-        assert profile.updated_at == now
+        assert profile.created_at == profile_data["created_at"]
+        assert profile.updated_at == profile_data["updated_at"]
 
-    def test_missing_id_raises(self) -> None:
-        """
-        Verify missing id raises ValidationError.
+    @pytest.mark.parametrize(
+        "missing_fields",
+        [("id",), ("created_at", "updated_at")],
+        ids=["id", "timestamps"],
+    )
+    def test_missing_metadata_raises(self, profile_data: dict[str, Any], missing_fields: tuple[str, ...]) -> None:
         """
-        now = datetime.now(UTC)
-        with pytest.raises(ValidationError):
-            Profile.model_validate(
-                {
-                    "first_name": "John",
-                    "last_name": "Doe",
-                    "email": "john@example.com",
-                    "phone_number": "+358401234567",
-                    "marketing": True,
-                    "terms": True,
-                    "created_at": now,
-                    "updated_at": now,
-                }
-            )
-
-    def test_missing_timestamps_raises(self) -> None:
-        """
-        Verify missing timestamps raise ValidationError.
+        Verify missing id or timestamps raise ValidationError.
         """
-        with pytest.raises(ValidationError):
-            Profile.model_validate(
-                {
-                    "id": "user-123",
-                    "first_name": "John",
-                    "last_name": "Doe",
-                    "email": "john@example.com",
-                    "phone_number": "+358401234567",
-                    "marketing": True,
-                    "terms": True,
-                }
-            )
-
-    def test_id_max_length_raises(self) -> None:
+        data = {key: value for key, value in profile_data.items() if key not in missing_fields}
+
+        with pytest.raises(ValidationError) as exc_info:
+            Profile.model_validate(data)
+
+        assert {err["loc"] for err in exc_info.value.errors()} == {(field,) for field in missing_fields}
+
+    def test_id_max_length_raises(self, profile_data: dict[str, Any]) -> None:
         """
         Verify id exceeding max length raises ValidationError.
         """
-        now = datetime.now(UTC)
         with pytest.raises(ValidationError):
-            Profile(
-                id="x" * 129,
-                first_name="John",
-                last_name="Doe",
-                email="john@example.com",
-                phone_number="+358401234567",
-                marketing=True,
-                terms=True,
-                created_at=now,
-                updated_at=now,
-            )
+            Profile.model_validate({**profile_data, "id": "x" * 129})
 
 
 class TestProfileCollection:
@@ -3,7 +3,8 @@ Unit tests for application lifespan and main module.
 """
 
 import sys
-from unittest.mock import patch
+from collections.abc import Generator
+from unittest.mock import MagicMock, call, patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -14,57 +15,56 @@ from fastapi_request_observability import (
     TraceContextLevel,
 )
 
+from app.core.config import get_settings
 from app.middleware import SecurityHeadersMiddleware
 
+CORS_RELOADED_MODULES = ("app.main", "app.core.config", "app.core.exception_handler")
+
+
+@pytest.fixture(scope="module")
+def lifespan_hooks() -> MagicMock:
+    """
+    Run the application lifespan once with its startup and shutdown hooks patched.
+
+    The hooks are children of one parent mock, so its mock_calls records their order.
+    """
+    hooks = MagicMock()
+    with (
+        patch("app.main.configure_logging", hooks.configure_logging),
+        patch("app.main.initialize_firebase", hooks.initialize_firebase),
+        patch("app.main.close_async_firestore_client", hooks.close_async_firestore_client),
+    ):
+        from app.main import app
+
+        with TestClient(app):
+            pass
+
+    return hooks
+
 
 class TestLifespan:
     """
     Tests for application lifespan events.
     """
 
-    def test_startup_initializes_logging(self) -> None:
+    def test_startup_initializes_logging(self, lifespan_hooks: MagicMock) -> None:
         """
         Verify lifespan startup configures logging.
         """
-        with (
-            patch("app.main.configure_logging") as mock_configure_logging,
-            patch("app.main.initialize_firebase"),
-            patch("app.main.close_async_firestore_client"),
-        ):
-            from app.main import app
+        lifespan_hooks.configure_logging.assert_called_once_with()
 
-            with TestClient(app):
-                mock_configure_logging.assert_called_once()
-
-    def test_startup_initializes_firebase(self) -> None:
+    def test_startup_initializes_firebase(self, lifespan_hooks: MagicMock) -> None:
         """
         Verify lifespan startup calls initialize_firebase.
         """
-        with (
-            patch("app.main.configure_logging"),
-            patch("app.main.initialize_firebase") as mock_init_firebase,
-            patch("app.main.close_async_firestore_client"),
-        ):
-            from app.main import app
-
-            with TestClient(app):
-                mock_init_firebase.assert_called_once()
+        lifespan_hooks.initialize_firebase.assert_called_once_with()
 
-    def test_shutdown_closes_firestore_client(self) -> None:
+    def test_shutdown_closes_firestore_client(self, lifespan_hooks: MagicMock) -> None:
         """
-        Verify lifespan shutdown calls close_async_firestore_client.
+        Verify lifespan shutdown calls close_async_firestore_client after startup.
         """
-        with (
-            patch("app.main.configure_logging"),
-            patch("app.main.initialize_firebase"),
-            patch("app.main.close_async_firestore_client") as mock_close,
-        ):
-            from app.main import app
-
-            with TestClient(app):
-                pass
-
-            mock_close.assert_called_once_with()
+        lifespan_hooks.close_async_firestore_client.assert_called_once_with()
+        assert lifespan_hooks.mock_calls[-1] == call.close_async_firestore_client()
 
 
 class TestAppConfiguration:
@@ -147,178 +147,123 @@ class TestRouterConfiguration:
         assert "/health" in fastapi_app.openapi()["paths"]
 
 
+@pytest.fixture(scope="module")
+def cors_client() -> Generator[TestClient]:
+    """
+    Import the application once with CORS origins configured and share its client.
+
+    The application modules are evicted first so settings are re-read from the patched environment.
+    On teardown the originals are put back in sys.modules and on their parent packages, and the
+    settings cache they share is cleared, so later tests see the default application again.
+    """
+    saved_modules = {module: sys.modules.pop(module, None) for module in CORS_RELOADED_MODULES}
+    try:
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setenv("CORS_ORIGINS", '["http://localhost:3000"]')
+
+            with (
+                patch("app.main.configure_logging"),
+                patch("app.main.initialize_firebase"),
+                patch("app.main.close_async_firestore_client"),
+            ):
+                from app.main import app
+
+                with TestClient(app) as client:
+                    yield client
+    finally:
+        for module, original in saved_modules.items():
+            package, _, name = module.rpartition(".")
+            if original is None:
+                sys.modules.pop(module, None)
+                vars(sys.modules[package]).pop(name, None)
+            else:
+                sys.modules[module] = original
+                setattr(sys.modules[package], name, original)
+        # Modules imported before the fixture read settings through the original cache.
+        get_settings.cache_clear()
+
+
 class TestCORSMiddleware:
     """
     Tests for CORS middleware configuration.
     """
 
-    def test_cors_preflight_handled_when_configured(
-        self,
-        monkeypatch: pytest.MonkeyPatch,
-    ) -> None:
+    def test_cors_preflight_handled_when_configured(self, cors_client: TestClient) -> None:
         """
         Verify CORS preflight requests work when origins are configured.
         """
-        monkeypatch.setenv("CORS_ORIGINS", '["http://localhost:3000"]')
-
-        if "app.main" in sys.modules:
-            del sys.modules["app.main"]
-        if "app.core.config" in sys.modules:
-            del sys.modules["app.core.config"]
-
-        with (
-            patch("app.main.configure_logging"),
-            patch("app.main.initialize_firebase"),
-            patch("app.main.close_async_firestore_client"),
-        ):
-            from app.main import app
-
-            with TestClient(app) as client:
-                response = client.options(
-                    "/",
-                    headers={
-                        "Origin": "http://localhost:3000",
-                        "Access-Control-Request-Method": "GET",
-                    },
-                )
-
-            assert response.status_code == 200
-            assert "access-control-allow-origin" in response.headers
-
-    def test_cors_error_response_has_one_origin_variance(
-        self,
-        monkeypatch: pytest.MonkeyPatch,
-    ) -> None:
+        response = cors_client.options(
+            "/",
+            headers={
+                "Origin": "http://localhost:3000",
+                "Access-Control-Request-Method": "GET",
+            },
+        )
+
+        assert response.status_code == 200
+        assert "access-control-allow-origin" in response.headers
+
+    def test_cors_error_response_has_one_origin_variance(self, cors_client: TestClient) -> None:
         """
         Verify the outer CORS middleware is the single owner of CORS headers.
         """
-        monkeypatch.setenv("CORS_ORIGINS", '["http://localhost:3000"]')
-
-        if "app.main" in sys.modules:
-            del sys.modules["app.main"]
-        if "app.core.config" in sys.modules:
-            del sys.modules["app.core.config"]
-        if "app.core.exception_handler" in sys.modules:
-            del sys.modules["app.core.exception_handler"]
-
-        with (
-            patch("app.main.configure_logging"),
-            patch("app.main.initialize_firebase"),
-            patch("app.main.close_async_firestore_client"),
-        ):
-            from app.main import app
-
-            with TestClient(app, raise_server_exceptions=False) as client:
-                response = client.get("/missing", headers={"Origin": "http://localhost:3000"})
+        with TestClient(cors_client.app, raise_server_exceptions=False) as error_client:
+            response = error_client.get("/missing", headers={"Origin": "http://localhost:3000"})
 
         assert response.status_code == 404
         assert response.headers["access-control-allow-origin"] == "http://localhost:3000"
         assert response.headers["vary"].split(", ").count("Origin") == 1
 
-    def test_cors_allows_specific_methods(
-        self,
-        monkeypatch: pytest.MonkeyPatch,
-    ) -> None:
+    def test_cors_allows_specific_methods(self, cors_client: TestClient) -> None:
         """
         Verify CORS is configured with specific allowed methods, not wildcards.
         """
-        monkeypatch.setenv("CORS_ORIGINS", '["http://localhost:3000"]')
-
-        if "app.main" in sys.modules:
-            del sys.modules["app.main"]
-        if "app.core.config" in sys.modules:
-            del sys.modules["app.core.config"]
-
-        with (
-            patch("app.main.configure_logging"),
-            patch("app.main.initialize_firebase"),
-            patch("app.main.close_async_firestore_client"),
-        ):
-            from app.main import app
-
-            with TestClient(app) as client:
-                response = client.options(
-                    "/",
-                    headers={
-                        "Origin": "http://localhost:3000",
-                        "Access-Control-Request-Method": "GET",
-                    },
-                )
-
-            allowed_methods = response.headers.get("access-control-allow-methods", "")
-            assert "GET" in allowed_methods
-            assert "POST" in allowed_methods
-            assert "PUT" in allowed_methods
-            assert "PATCH" in allowed_methods
-            assert "DELETE" in allowed_methods
-            assert "OPTIONS" in allowed_methods
-
-    def test_cors_allows_specific_headers(
-        self,
-        monkeypatch: pytest.MonkeyPatch,
-    ) -> None:
+        response = cors_client.options(
+            "/",
+            headers={
+                "Origin": "http://localhost:3000",
+                "Access-Control-Request-Method": "GET",
+            },
+        )
+
+        allowed_methods = response.headers.get("access-control-allow-methods", "")
+        assert "GET" in allowed_methods
+        assert "POST" in allowed_methods
+        assert "PUT" in allowed_methods
+        assert "PATCH" in allowed_methods
+        assert "DELETE" in allowed_methods
+        assert "OPTIONS" in allowed_methods
+
+    def test_cors_allows_specific_headers(self, cors_client: TestClient) -> None:
         """
         Verify CORS is configured with specific allowed headers, not wildcards.
         """
-        monkeypatch.setenv("CORS_ORIGINS", '["http://localhost:3000"]')
-
-        if "app.main" in sys.modules:
-            del sys.modules["app.main"]
-        if "app.core.config" in sys.modules:
-            del sys.modules["app.core.config"]
-
-        with (
-            patch("app.main.configure_logging"),
-            patch("app.main.initialize_firebase"),
-            patch("app.main.close_async_firestore_client"),
-        ):
-            from app.main import app
-
-            with TestClient(app) as client:
-                response = client.options(
-                    "/",
-                    headers={
-                        "Origin": "http://localhost:3000",
-                        "Access-Control-Request-Method": "GET",
-                        "Access-Control-Request-Headers": "Authorization, Content-Type",
-                    },
-                )
-
-            allowed_headers = response.headers.get("access-control-allow-headers", "").lower()
-            assert "authorization" in allowed_headers
-            assert "content-type" in allowed_headers
-
-    def test_cors_allows_trace_context_headers_for_logging(
-        self,
-        monkeypatch: pytest.MonkeyPatch,
-    ) -> None:
+        response = cors_client.options(
+            "/",
+            headers={
+                "Origin": "http://localhost:3000",
+                "Access-Control-Request-Method": "GET",
+                "Access-Control-Request-Headers": "Authorization, Content-Type",
+            },
+        )
+
+        allowed_headers = response.headers.get("access-control-allow-headers", "").lower()
+        assert "authorization" in allowed_headers
+        assert "content-type" in allowed_headers
+
+    def test_cors_allows_trace_context_headers_for_logging(self, cors_client: TestClient) -> None:
         """
         Verify CORS allows W3C trace context headers for observability middleware.
         """
-        monkeypatch.setenv("CORS_ORIGINS", '["http://localhost:3000"]')
-
-        if "app.main" in sys.modules:
-            del sys.modules["app.main"]
-        if "app.core.config" in sys.modules:
-            del sys.modules["app.core.config"]
-
-        with (
-            patch("app.main.configure_logging"),
-            patch("app.main.initialize_firebase"),
-            patch("app.main.close_async_firestore_client"),
-        ):
-            from app.main import app
-
-            with TestClient(app) as client:
-                response = client.options(
-                    "/",
-                    headers={
-                        "Origin": "http://localhost:3000",
-                        "Access-Control-Request-Method": "GET",
-                        "Access-Control-Request-Headers": "traceparent, tracestate",
-                    },
-                )
-
-            allowed_headers = response.headers.get("access-control-allow-headers", "").lower()
-            assert "traceparent" in allowed_headers
-            assert "tracestate" in allowed_headers
+        response = cors_client.options(
+            "/",
+            headers={
+                "Origin": "http://localhost:3000",
+                "Access-Control-Request-Method": "GET",
+                "Access-Control-Request-Headers": "traceparent, tracestate",
+            },
+        )
+
+        allowed_headers = response.headers.get("access-control-allow-headers", "").lower()
+        assert "traceparent" in allowed_headers
+        assert "tracestate" in allowed_headers